@@ -34,6 +34,16 @@ pub async fn remove(key: &str) -> Option<Ele> {
     CONFIG_STORE.write().await.remove(key)
 }
 
+/// Remove several configuration keys under a single write lock.
+///
+/// Returns the number of keys actually removed.
+pub async fn remove_many(keys: &[String]) -> usize {
+    let mut store = CONFIG_STORE.write().await;
+    keys.iter()
+        .filter(|key| store.remove(*key).is_some())
+        .count()
+}
+
 /// Check if a key exists.
 pub async fn contains_key(key: &str) -> bool {
     CONFIG_STORE.read().await.contains_key(key)
@@ -152,6 +152,16 @@ fn remove(_py: Python, key: String) -> PyResult<Option<Py<PyAny>>> {
     })
 }
 
+/// Remove several configuration keys in one call.
+///
+/// Returns the number of keys actually removed.
+#[pyfunction(name = "config_remove_many")]
+fn remove_many(_py: Python, keys: Vec<String>) -> PyResult<usize> {
+    with_detached_native(move || {
+        block_on(async move { config::remove_many(&keys).await }).map_err(runtime_err)
+    })
+}
+
 /// Get all configuration keys.
 #[pyfunction(name = "config_keys")]
 fn keys(_py: Python) -> PyResult<Vec<String>> {
@@ -184,6 +194,7 @@ pub fn register_config_functions(module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_function(wrap_pyfunction!(get_str, module)?)?;
     module.add_function(wrap_pyfunction!(contains_key, module)?)?;
     module.add_function(wrap_pyfunction!(remove, module)?)?;
+    module.add_function(wrap_pyfunction!(remove_many, module)?)?;
     module.add_function(wrap_pyfunction!(keys, module)?)?;
     module.add_function(wrap_pyfunction!(clear, module)?)?;
     module.add_function(wrap_pyfunction!(len, module)?)?;
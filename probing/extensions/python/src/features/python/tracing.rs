@@ -121,12 +121,12 @@ fn capture_span_snapshot_for_crash() {
 }
 
 fn push_span_hint(span: &Span) {
-    let hint = SpanHint {
-        trace_id: span.with_inner(|s| s.trace_id),
-        span_id: span.with_inner(|s| s.span_id),
-        name: span.with_inner(|s| s.name.clone()),
-        phase: span.with_inner(|s| s.phase.clone()),
-    };
+    let hint = span.with_inner(|s| SpanHint {
+        trace_id: s.trace_id,
+        span_id: s.span_id,
+        name: s.name.clone(),
+        phase: s.phase.clone(),
+    });
     SPAN_HINT_STACK.with(|stack| stack.borrow_mut().push(hint));
 }
 
@@ -157,7 +157,9 @@ impl Span {
         f(&lock_span(&self.inner))
     }
 
-    fn with_inner_mut<R>(&mut self, f: impl FnOnce(&mut RawSpan) -> R) -> R {
+    // Mutation goes through the Mutex, so `&self` suffices; keeping mutators
+    // off `&mut self` avoids the exclusive PyRefMut borrow check per call.
+    fn with_inner_mut<R>(&self, f: impl FnOnce(&mut RawSpan) -> R) -> R {
         f(&mut lock_span(&self.inner))
     }
 }
@@ -229,10 +231,10 @@ impl Span {
 
     /// Gets the span status.
     #[getter]
-    fn status(&self) -> String {
+    fn status(&self) -> &'static str {
         match self.with_inner(|s| s.status()) {
-            SpanStatus::Active => "Active".to_string(),
-            SpanStatus::Completed => "Completed".to_string(),
+            SpanStatus::Active => "Active",
+            SpanStatus::Completed => "Completed",
         }
     }
 
@@ -274,7 +276,7 @@ impl Span {
     /// Internal method to set initial attributes during span creation.
     /// This should only be called by the Python wrapper during span creation.
     #[pyo3(name = "_set_initial_attrs")]
-    fn set_initial_attrs(&mut self, attrs: &Bound<'_, PyAny>, _py: Python) -> PyResult<()> {
+    fn set_initial_attrs(&self, attrs: &Bound<'_, PyAny>, _py: Python) -> PyResult<()> {
         let attrs_dict = attrs.cast::<PyDict>().map_err(|_| {
             PyErr::new::<pyo3::exceptions::PyTypeError, _>("_set_initial_attrs expects a dict")
         })?;
@@ -292,7 +294,7 @@ impl Span {
     /// Adds an event to the span.
     #[pyo3(signature = (name, *, attributes=None))]
     fn add_event(
-        &mut self,
+        &self,
         name: String,
         attributes: Option<Vec<Py<PyAny>>>,
         py: Python,
@@ -307,12 +309,12 @@ impl Span {
     }
 
     /// Ends the span.
-    fn end(&mut self) {
+    fn end(&self) {
         self.with_inner_mut(|inner| inner.end());
     }
 
     /// Ends the span with an error message.
-    fn end_error(&mut self, error_message: Option<String>) {
+    fn end_error(&self, error_message: Option<String>) {
         self.with_inner_mut(|inner| inner.end_error(error_message));
     }
 
@@ -323,9 +325,12 @@ impl Span {
 
     /// Gets all events as a list.
     fn get_events(&self, py: Python) -> PyResult<Py<PyAny>> {
+        // Copy events out first: building the Python dicts allocates and can
+        // run arbitrary code, which must not happen under the span lock while
+        // other threads are appending events.
+        let events: Vec<RawEvent> = self.with_inner(|inner| inner.events.clone());
         let list = PyList::empty(py);
-        let inner = lock_span(&self.inner);
-        for event in &inner.events {
+        for event in &events {
             let event_dict = PyDict::new(py);
             event_dict.set_item("name", &event.name)?;
             event_dict.set_item("timestamp", event.timestamp.0 as u64)?;
@@ -391,32 +396,26 @@ impl Span {
         if exc_type.is_some_and(|t| !t.is_none()) {
             capture_span_snapshot_for_crash();
         }
+        // Already attached inside a pymethod; reuse the token instead of
+        // re-attaching per stack entry.
+        let py = slf.py();
         let self_id = slf.span_id();
         lock_span(&slf.inner).end();
         pop_span_hint(self_id);
 
+        let matches_self = |obj: &Py<PyAny>| {
+            obj.bind(py)
+                .cast::<Span>()
+                .ok()
+                .is_some_and(|span| span.borrow().span_id() == self_id)
+        };
         SPAN_STACK.with(|stack| {
             let mut stack = stack.borrow_mut();
-            if let Some(top) = stack.last() {
-                let top_matches = Python::attach(|py| {
-                    top.bind(py)
-                        .cast::<Span>()
-                        .ok()
-                        .is_some_and(|span| span.borrow().span_id() == self_id)
-                });
-                if top_matches {
-                    stack.pop();
-                    return;
-                }
+            if stack.last().is_some_and(&matches_self) {
+                stack.pop();
+                return;
             }
-            if let Some(pos) = stack.iter().rposition(|obj| {
-                Python::attach(|py| {
-                    obj.bind(py)
-                        .cast::<Span>()
-                        .ok()
-                        .is_some_and(|span| span.borrow().span_id() == self_id)
-                })
-            }) {
+            if let Some(pos) = stack.iter().rposition(matches_self) {
                 stack.remove(pos);
             }
         });
@@ -426,8 +425,14 @@ impl Span {
 
     /// Returns a string representation of the span.
     fn __repr__(&self) -> String {
+        use std::fmt::Write;
+
         self.with_inner(|inner| {
-            format!(
+            // Preallocate for the fixed fields plus a typical name; avoids
+            // format!'s incremental growth for this logging-path string.
+            let mut out = String::with_capacity(64 + inner.name.len());
+            let _ = write!(
+                out,
                 "Span(name={}, trace_id={}, span_id={}, status={})",
                 inner.name,
                 inner.trace_id,
@@ -436,7 +441,8 @@ impl Span {
                     SpanStatus::Active => "Active",
                     SpanStatus::Completed => "Completed",
                 }
-            )
+            );
+            out
         })
     }
 }
@@ -477,11 +483,10 @@ fn active_span_by_phase(py: Python, phase: String) -> PyResult<Option<Py<PyAny>>
         for obj in stack.iter().rev() {
             let bound = obj.bind(py);
             if let Ok(span) = bound.cast::<Span>() {
-                let borrowed = span.borrow();
-                if borrowed.is_ended() {
-                    continue;
-                }
-                if borrowed.phase().as_deref() == Some(phase.as_str()) {
+                let matches = span
+                    .borrow()
+                    .with_inner(|s| !s.is_ended() && s.phase.as_deref() == Some(phase.as_str()));
+                if matches {
                     return Ok(Some(obj.clone_ref(py)));
                 }
             }
@@ -498,15 +503,18 @@ fn active_training_phase(py: Python) -> PyResult<Option<String>> {
         for obj in stack.iter().rev() {
             let bound = obj.bind(py);
             if let Ok(span) = bound.cast::<Span>() {
-                let borrowed = span.borrow();
-                if borrowed.is_ended() {
-                    continue;
-                }
-                if let Some(phase) = borrowed.phase() {
-                    match phase.as_str() {
-                        "forward" | "backward" | "optimizer" => return Ok(Some(phase)),
-                        _ => {}
+                // Single lock per candidate; clone the phase only on a hit.
+                let phase = span.borrow().with_inner(|s| {
+                    if s.is_ended() {
+                        return None;
+                    }
+                    match s.phase.as_deref() {
+                        Some(p @ ("forward" | "backward" | "optimizer")) => Some(p.to_string()),
+                        _ => None,
                     }
+                });
+                if let Some(phase) = phase {
+                    return Ok(Some(phase));
                 }
             }
         }
@@ -1,7 +1,10 @@
 use std::ffi::CString;
 use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Mutex;
 
 use anyhow::Context;
+use once_cell::sync::Lazy;
+use probing_core::sync::lock_mutex;
 use pyo3::prelude::*;
 use pyo3::{types::PyDict, Bound, Python};
 
@@ -58,9 +61,19 @@ pub fn should_enable_probing() -> bool {
             let Some((_, pattern)) = probe_value.split_once(':') else {
                 return false;
             };
-            let Ok(regex) = regex::Regex::new(pattern) else {
-                return false;
-            };
+            // The pattern is fixed for a process's lifetime; compile it once
+            // and reuse. The decision itself stays env-driven so callers (and
+            // tests) that flip PROBING between calls see the change.
+            static COMPILED: Lazy<Mutex<Option<(String, regex::Regex)>>> =
+                Lazy::new(|| Mutex::new(None));
+            let mut cache = lock_mutex(&COMPILED, "probing regex cache");
+            if cache.as_ref().is_none_or(|(p, _)| p != pattern) {
+                let Ok(regex) = regex::Regex::new(pattern) else {
+                    return false;
+                };
+                *cache = Some((pattern.to_string(), regex));
+            }
+            let regex = &cache.as_ref().expect("regex cache just populated").1;
             Python::attach(script_basename)
                 .map(|name| regex.is_match(&name))
                 .unwrap_or(false)
@@ -33,18 +33,34 @@ def is_probing_cli() -> bool:
 
 _LIGHTWEIGHT_MODULES = ("probing.nccl", "probing.skills", "probing.dev_pth")
 
+# ``PROBING`` mode tokens (lower-cased), shared with the site hook.
+FALSY_TOKENS = frozenset(("0", "", "false", "no", "off"))
+FOLLOWED_TOKENS = frozenset(("1", "followed"))
+NESTED_TOKENS = frozenset(("2", "nested"))
+
+# ``regex:`` patterns compiled once per process; ``re`` stays a lazy import so
+# the common non-regex startup path never pays for it.
+_PATTERN_CACHE: dict = {}
+
+
+def _compiled_pattern(pattern: str):
+    regex = _PATTERN_CACHE.get(pattern)
+    if regex is None:
+        import re
+
+        regex = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return regex
+
 
 def should_activate_probing() -> bool:
     """True when ``PROBING`` / ``PROBING_ORIGINAL`` targets this process."""
     raw = os.environ.get("PROBING_ORIGINAL") or os.environ.get("PROBING", "0")
     token = raw.strip().lower()
-    if token in ("0", "", "false", "no", "off"):
+    if token in FALSY_TOKENS:
         return False
-    if token in ("1", "followed", "2", "nested"):
+    if token in FOLLOWED_TOKENS or token in NESTED_TOKENS:
         return True
     if raw.lower().startswith("regex:"):
-        import re
-
         pattern = raw.split(":", 1)[1]
         candidates: list[str] = [c for c in sys.argv if c]
         candidates.append(current_script_name())
@@ -57,7 +73,8 @@ def should_activate_probing() -> bool:
                 candidates.append(os.path.basename(main_file))
         except Exception:
             pass
-        return any(re.search(pattern, c) for c in candidates if c)
+        search = _compiled_pattern(pattern).search
+        return any(search(c) for c in candidates if c)
     return raw == current_script_name()
 
 
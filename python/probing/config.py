@@ -28,6 +28,11 @@ def remove(key):
     return _core.config_remove(key)
 
 
+def remove_many(keys):
+    """Remove several keys in one FFI call; returns how many were removed."""
+    return _core.config_remove_many(list(keys))
+
+
 def keys():
     return _core.config_keys()
 
@@ -98,6 +98,9 @@ def table(
         Adds a single instance to the table.
     append_many(instances) : classmethod
         Adds multiple instances to the table.
+    append_rows(rows) : classmethod
+        Adds pre-built field-ordered tuples, skipping instance construction
+        (for bulk writers that already hold flat row data).
     take(n) : classmethod
         Retrieves n rows from the table.
     drop() : classmethod
@@ -191,6 +194,13 @@ def table(
             table = cls.init_table()
             table.append_many([_row(i) for i in instances])
 
+        @classmethod
+        def append_rows(cls, rows):
+            # rows are tuples already in declared-field order; no per-row
+            # dataclass round trip.
+            table = cls.init_table()
+            table.append_many(rows if isinstance(rows, list) else list(rows))
+
         @classmethod
         def take(cls, n):
             if cls not in cache:
@@ -210,6 +220,7 @@ def table(
         setattr(cls, "init_table", init_table)
         setattr(cls, "append", append)
         setattr(cls, "append_many", append_many)
+        setattr(cls, "append_rows", append_rows)
         setattr(cls, "take", take)
         setattr(cls, "drop", drop)
         setattr(cls, "save", save)
@@ -21,7 +21,7 @@ import os
 import socket
 from typing import Any, Optional
 
-from probing.utils.py import _get_attr, _get_ray
+from probing.utils.py import _get_attr, _get_ray, make_get_attr
 
 
 RAY_PROCESS_FIELDS = [
@@ -468,26 +468,24 @@ def setup_tracing() -> None:
         pass
 
 
+# Fixed key sets probed per worker/event; pre-parsed once via make_get_attr.
+_get_worker_pid = make_get_attr(["pid", "worker_pid", "process_id", "processId"])
+_get_worker_id = make_get_attr(["worker_id", "workerId", "id"], "")
+_get_worker_node_id = make_get_attr(["node_id", "nodeId"], "")
+_get_event_type = make_get_attr(["event_type", "type"])
+_get_event_time_ms = make_get_attr(["time_ms", "timestamp_ms", "timestamp"])
+
+
 def _worker_pid(worker_info) -> int:
-    return _safe_int(
-        _get_attr(
-            worker_info,
-            [
-                "pid",
-                "worker_pid",
-                "process_id",
-                "processId",
-            ],
-        )
-    )
+    return _safe_int(_get_worker_pid(worker_info))
 
 
 def _worker_id(worker_info) -> str:
-    return _safe_str(_get_attr(worker_info, ["worker_id", "workerId", "id"], ""))
+    return _safe_str(_get_worker_id(worker_info))
 
 
 def _worker_node_id(worker_info) -> str:
-    return _safe_str(_get_attr(worker_info, ["node_id", "nodeId"], ""))
+    return _safe_str(_get_worker_node_id(worker_info))
 
 
 def _collect_worker_info() -> dict[str, dict[str, Any]]:
@@ -530,8 +528,8 @@ def _extract_time_from_events(events):
 
     for event in events:
         # Events are typically dict-like objects with 'event_type' and 'time_ms' fields
-        event_type = _get_attr(event, ["event_type", "type"])
-        time_ms = _get_attr(event, ["time_ms", "timestamp_ms", "timestamp"])
+        event_type = _get_event_type(event)
+        time_ms = _get_event_time_ms(event)
 
         if not time_ms:
             continue
@@ -9,7 +9,7 @@ import json
 import logging
 import sys
 import traceback
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from probing.handlers.router import ext_handler, handle_request
 
@@ -440,14 +440,14 @@ def stop_pytorch_profile() -> str:
 
 
 @ext_handler("pythonext", "pytorch/profile/status")
-def pytorch_profile_status() -> str:
+def pytorch_profile_status() -> Dict[str, Any]:
     """Profiler running state and latest capture id."""
     try:
         from probing.profiling.torch_profiler import profiler_status
 
-        return json.dumps(profiler_status())
+        return profiler_status()
     except Exception as e:
-        return json.dumps({"error": str(e), "traceback": traceback.format_exc()})
+        return {"error": str(e), "traceback": traceback.format_exc()}
 
 
 @ext_handler("pythonext", "flight-recorder/snapshot")
@@ -722,10 +722,10 @@ def register_slime_inference_engine(
         "pythonext/engines/list",
     ],
 )
-def list_inference_engines() -> str:
+def list_inference_engines() -> Dict[str, Any]:
     from probing.ext.engines import list_engines
 
-    return json.dumps({"engines": [engine.to_dict() for engine in list_engines()]})
+    return {"engines": [engine.to_dict() for engine in list_engines()]}
 
 
 @ext_handler(
@@ -6,12 +6,36 @@ with automatic parameter parsing and validation.
 
 import inspect
 import json
+import sys
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-# Global router state
+try:  # Optional fast path; responses are identical modulo whitespace.
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _dumps = json.dumps
+
+# Global router state. Deliberately a plain mutable dict: ext_handler is a
+# public extension point and extensions register whenever they are imported,
+# so there is no "after setup" moment to freeze behind a MappingProxyType.
+# Keys are interned at registration, which is where the probe speed comes
+# from; a read-only view would add indirection without making lookups faster.
 _handlers: Dict[str, Dict[str, Any]] = {}
 
+# Alias path -> canonical path. Kept out of _handlers so the registry holds
+# every handler exactly once under its canonical path (the api_spec contract);
+# aliases cost one extra dict probe, and only on their own dispatch.
+_path_aliases: Dict[str, str] = {}
+
+# Canonical JSON for the one error response with no dynamic content.
+# Parameterized errors embed request-supplied strings and keep json.dumps
+# for its escaping rather than splicing into a cached template.
+_ERR_MISSING_BODY = _dumps({"error": "Missing request body"})
+
 
 def _normalize_path(path: str) -> str:
     """Normalize path by removing leading slashes."""
@@ -40,20 +64,83 @@ def _parse_param(value: str, param_type: str) -> Any:
     >>> _parse_param("123", "optional_int")
     123
     """
-    if param_type == "string":
-        return value
-    elif param_type in ("int", "i64", "usize"):
-        return int(value)
-    elif param_type == "bool":
-        return value.lower() in ("true", "1", "yes", "on")
-    elif param_type == "string_list":
-        return [s.strip() for s in value.split(",") if s.strip()]
-    elif param_type == "optional_string":
-        return value if value else None
-    elif param_type in ("optional_int", "optional_i64"):
-        return int(value) if value else None
-    else:
-        return value
+    converter = _CONVERTERS.get(param_type)
+    return value if converter is None else converter(value)
+
+
+# Accepted truthy spellings in the casings requests actually send; the
+# lowercase fallback keeps odd mixed casings ("tRuE") behaving as before
+# without paying str.lower() on the common path.
+_TRUE_TOKENS = frozenset(
+    ("true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON")
+)
+
+
+def _parse_bool(value: str) -> bool:
+    return value in _TRUE_TOKENS or value.lower() in ("true", "1", "yes", "on")
+
+
+def _parse_string_list(value: str) -> List[str]:
+    # str.split already scans with memchr in C; just avoid stripping twice.
+    return [t for s in value.split(",") if (t := s.strip())]
+
+
+def _parse_optional_string(value: str) -> Optional[str]:
+    return value if value else None
+
+
+def _parse_optional_int(value: str) -> Optional[int]:
+    return int(value) if value else None
+
+
+# Type-name -> converter; None means the raw string is passed through.
+# Int types use bare int() on purpose: a prevalidating regex would reject
+# inputs int() accepts ("1_000", " 42 ", unicode digits) and tax every
+# well-formed request, while the try/except in _parse_params is free on
+# the happy path (zero-cost exceptions since 3.11) and malformed values
+# terminate in an error response regardless.
+_CONVERTERS: Dict[str, Optional[Callable[[str], Any]]] = {
+    "string": None,
+    "int": int,
+    "i64": int,
+    "usize": int,
+    "bool": _parse_bool,
+    "string_list": _parse_string_list,
+    "optional_string": _parse_optional_string,
+    "optional_int": _parse_optional_int,
+    "optional_i64": _parse_optional_int,
+}
+
+_OPTIONAL_TYPES = frozenset(("optional_string", "optional_int", "optional_i64"))
+
+# Plan fallbacks for a parameter absent from the request.
+_SKIP = object()
+
+
+def _build_parse_plan(
+    param_types: Dict[str, str],
+    required_params: Sequence[str],
+    param_defaults: Dict[str, Any],
+) -> Tuple[Tuple[str, Optional[Callable[[str], Any]], Any], ...]:
+    """Precompute ``(name, converter, fallback)`` triples for a handler.
+
+    ``fallback`` is the value used when the parameter is missing from the
+    request, or ``_SKIP`` when the parameter is simply omitted (required
+    parameters are validated before the plan runs).
+    """
+    required = set(required_params)
+    plan = []
+    for param_name, param_type in param_types.items():
+        if param_type in _OPTIONAL_TYPES:
+            fallback = param_defaults.get(param_name)
+        elif param_name not in required and param_name in param_defaults:
+            fallback = param_defaults[param_name]
+        else:
+            fallback = _SKIP
+        plan.append((param_name, _CONVERTERS.get(param_type), fallback))
+    # Tuples iterate marginally faster and make the registration-time plan
+    # immutable by construction.
+    return tuple(plan)
 
 
 def _infer_param_defaults(func: Callable) -> Dict[str, Any]:
@@ -119,29 +206,33 @@ def _parse_params(
     >>> "Invalid parameter" in error
     True
     """
-    parsed = {}
     required_params = handler_info.get("required_params", [])
-    param_types = handler_info.get("param_types", {})
-    param_defaults = handler_info.get("param_defaults", {})
 
     # Check required parameters
     for param_name in required_params:
         if param_name not in params:
             return {}, f"Missing required parameter: {param_name}"
 
-    # Parse all parameters
-    for param_name, param_type in param_types.items():
-        if param_name in params:
+    plan = handler_info.get("plan")
+    if plan is None:
+        # Ad-hoc handler_info dicts (doctests, direct callers) carry no
+        # registration-time plan; build one on the fly.
+        plan = _build_parse_plan(
+            handler_info.get("param_types", {}),
+            required_params,
+            handler_info.get("param_defaults", {}),
+        )
+
+    parsed = {}
+    for param_name, converter, fallback in plan:
+        value = params.get(param_name, _SKIP)
+        if value is not _SKIP:
             try:
-                parsed[param_name] = _parse_param(params[param_name], param_type)
+                parsed[param_name] = value if converter is None else converter(value)
             except (ValueError, TypeError) as e:
                 return {}, f"Invalid parameter '{param_name}': {str(e)}"
-        elif param_type in ("optional_string", "optional_int", "optional_i64"):
-            parsed[param_name] = param_defaults.get(param_name)
-        elif param_name in required_params:
-            return {}, f"Missing required parameter: {param_name}"
-        elif param_name in param_defaults:
-            parsed[param_name] = param_defaults[param_name]
+        elif fallback is not _SKIP:
+            parsed[param_name] = fallback
 
     return parsed, None
 
@@ -186,39 +277,50 @@ def handle_request(
         True
     """
     try:
-        normalized_path = _normalize_path(path)
-
-        if normalized_path not in _handlers:
-            return json.dumps(
-                {
-                    "error": f"No handler found for path: {path}",
-                    "normalized_path": normalized_path,
-                }
-            )
-
-        handler_info = _handlers[normalized_path]
+        # Most callers pass canonical paths; probe directly and only pay for
+        # alias resolution and normalization (and their probes) on a miss.
+        handler_info = _handlers.get(path)
+        if handler_info is None:
+            alias_target = _path_aliases.get(path)
+            if alias_target is not None:
+                handler_info = _handlers.get(alias_target)
+        if handler_info is None:
+            normalized_path = _normalize_path(path)
+            handler_info = _handlers.get(normalized_path)
+            if handler_info is None:
+                alias_target = _path_aliases.get(normalized_path)
+                if alias_target is not None:
+                    handler_info = _handlers.get(alias_target)
+            if handler_info is None:
+                return _dumps(
+                    {
+                        "error": f"No handler found for path: {path}",
+                        "normalized_path": normalized_path,
+                    }
+                )
         try:
             if handler_info.get("uses_body"):
                 if body is None or body == "":
-                    return json.dumps({"error": "Missing request body"})
+                    return _ERR_MISSING_BODY
                 result = handler_info["function"](body)
             else:
                 parsed_params, error = _parse_params(params, handler_info)
 
                 if error:
-                    return json.dumps({"error": error})
+                    cached = handler_info.get("error_json", {}).get(error)
+                    return cached if cached is not None else _dumps({"error": error})
 
                 result = handler_info["function"](**parsed_params)
-            return result if isinstance(result, str) else json.dumps(result)
+            return result if isinstance(result, str) else _dumps(result)
         except Exception as e:
-            return json.dumps(
+            return _dumps(
                 {
                     "error": str(e),
                     "traceback": traceback.format_exc(),
                 }
             )
     except Exception as e:
-        return json.dumps(
+        return _dumps(
             {
                 "error": f"Router error: {str(e)}",
                 "traceback": traceback.format_exc(),
@@ -348,43 +450,70 @@ def _infer_required_params(func: Callable) -> List[str]:
 
 def ext_handler(
     ext_name: str,
-    path: str,
+    path: Union[str, List[str]],
     required_params: Optional[List[str]] = None,
     uses_body: bool = False,
 ):
-    """Decorator for registering extension handlers (single canonical path).
+    """Decorator for registering extension handlers.
 
     Usage:
         @ext_handler("pythonext", "trace/list")
         def list_trace(prefix: Optional[str] = None) -> str:
             ...
 
+    Handlers may return either a pre-serialized JSON string or a plain
+    Python object; the router serializes objects exactly once at the
+    response boundary, so object-returning handlers avoid a second
+    encode when the serializer changes or responses are post-processed.
+
     Args:
         ext_name: Extension name (e.g., "pythonext")
-        path: Canonical local path (e.g., "trace/list")
+        path: Canonical local path (e.g., "trace/list"), or a list of alias
+            paths that all resolve to the same handler
         required_params: List of required parameter names (auto-inferred if not provided)
         uses_body: When True, invoke handler with POST body as sole argument
     """
 
     def decorator(func: Callable) -> Callable:
-        canonical_path = path.strip("/")
-        if not canonical_path:
+        paths = [path] if isinstance(path, str) else list(path)
+        canonical_paths = [p.strip("/") for p in paths]
+        if not canonical_paths or not all(canonical_paths):
             raise ValueError("Handler path must not be empty")
 
         # Auto-infer parameter types and required params
         param_types = _infer_param_types(func)
         param_defaults = _infer_param_defaults(func)
-        required = required_params or _infer_required_params(func)
+        # Frozen like the plan: the schema never changes after registration.
+        required = tuple(required_params or _infer_required_params(func))
 
-        # Register handler
-        _handlers[canonical_path] = {
+        # One info dict per handler, registered once under the canonical
+        # path; alias paths route to it through _path_aliases at dispatch.
+        handler_info = {
             "function": func,
             "required_params": required,
             "param_types": param_types,
             "param_defaults": param_defaults,
+            "plan": _build_parse_plan(param_types, required, param_defaults),
+            # Pre-serialized responses for the fixed per-handler error
+            # messages, keyed by message so the hot error path is one probe.
+            "error_json": {
+                f"Missing required parameter: {name}": _dumps(
+                    {"error": f"Missing required parameter: {name}"}
+                )
+                for name in required
+            },
             "uses_body": uses_body,
             "ext_name": ext_name,
         }
+        # Paths form a closed set fixed at registration; interned keys let
+        # dict probes hit the pointer-equality fast path. Incoming request
+        # paths are left as-is — short ASCII literals from callers are
+        # usually interned by CPython already. The first path is canonical
+        # and owns the registry entry; the rest become aliases.
+        canonical_path = sys.intern(canonical_paths[0])
+        _handlers[canonical_path] = handler_info
+        for alias in canonical_paths[1:]:
+            _path_aliases[sys.intern(alias)] = canonical_path
 
         return func
 
@@ -1,4 +1,5 @@
 import logging
+import contextvars
 import ctypes
 import contextlib
 import fnmatch
@@ -8,11 +9,11 @@ import json
 import os
 import re
 import sys
-import threading
 import time
 import types
 import warnings
 from dataclasses import dataclass
+from operator import itemgetter
 from types import FrameType, FunctionType, ModuleType
 from typing import Any, AnyStr, Callable, Dict, List, Set, Optional
 
@@ -42,10 +43,21 @@ def _trace_warn(message: str) -> None:
         logger.warning("%s", message)
 
 
-thread_global = threading.local()
+# Per-thread stack of shadowed trace functions; a ContextVar slot is cheaper
+# to reach than a threading.local attribute on every tracer entry/exit.
+_tracer_stack: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar(
+    "probing_tracer_stack", default=None
+)
 internal_directories = os.path.dirname((lambda: 0).__code__.co_filename)
 
+# Filename -> is-internal decisions; the set of distinct co_filename strings
+# seen by a tracer is small and fixed, so each prefix scan runs once.
+_internal_filename_cache: Dict[str, bool] = {}
+
 traced_functions = {}
+# Serialized show_trace() payload; trace()/untrace() are the only mutators of
+# traced_functions and reset this to None.
+_show_trace_cache: Optional[str] = None
 # Global dictionary to store probe attributes for functions
 # Key: function code object id, Value: dict with __probe_func__, __probe_watch__, __probe_depth__
 _probe_attrs = {}
@@ -88,6 +100,38 @@ TRACE_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_.]*$")
 # torch.distributed.reduce_op emits FutureWarning on isinstance/inspect checks.
 _SKIP_TRAVERSAL_ATTRS = frozenset({"reduce_op"})
 
+# Exact types whose __name__ is guaranteed to be a plain string; used by
+# get_object_name to skip the defensive slow path.
+_NAMED_TYPES = frozenset({FunctionType, ModuleType, type})
+
+# C-level sort key for the item-dict results; no per-compare Python frame.
+_BY_NAME = itemgetter("name")
+
+# Exact-type classification fast path for determine_item_type. Deliberately
+# only the three unambiguous cases: builtins/methods stay "V" as before, and
+# subclasses (metaclasses, lazy modules) fall through to the isinstance chain.
+_ITEM_TYPE_MAP = {FunctionType: "F", type: "C", ModuleType: "M"}
+
+# Leaf built-in types: their __dict__ (a mappingproxy of slots) never yields
+# traceable functions, so traversal can prune them immediately.
+_SKIP_DICT_TYPES = frozenset(
+    {
+        int,
+        str,
+        float,
+        bool,
+        bytes,
+        bytearray,
+        tuple,
+        list,
+        dict,
+        set,
+        frozenset,
+        complex,
+        type(None),
+    }
+)
+
 
 @contextlib.contextmanager
 def _ignore_torch_reduce_op_deprecation():
@@ -106,6 +150,37 @@ def _should_skip_traversal_attr(prefix: str, key: str) -> bool:
     return prefix == "torch.distributed" or prefix.startswith("torch.distributed.")
 
 
+@functools.lru_cache(maxsize=4096)
+def _should_include_module_cached(
+    module_name: str, module: ModuleType, whitelist: tuple
+) -> bool:
+    """Cached body of _TraceableCollector.should_include_module.
+
+    Keyed on the module object itself so the spec-derived verdict stays
+    correct per instance; sys.modules keeps those objects alive anyway, and
+    the cache is bounded for transient modules.
+    """
+    # Handle whitelist modules
+    if module_name in whitelist:
+        return True
+
+    # Allow probing module
+    if module_name.startswith("probing"):
+        return isinstance(module_name, str) and not module_name.startswith("__")
+
+    # For other modules, check __spec__ and site-packages
+    if not hasattr(module, "__spec__"):
+        return False
+
+    try:
+        if module.__spec__ is None or "site-packages" not in module.__spec__.origin:
+            return False
+    except (AttributeError, TypeError):
+        return False
+
+    return isinstance(module_name, str) and not module_name.startswith("__")
+
+
 def _validate_trace_name(name: str) -> None:
     """Raise ValueError if name is not allowed for trace/untrace (security)."""
     if not name or not isinstance(name, str):
@@ -163,11 +238,27 @@ class _TraceableCollector:
     # Class-level constants
     WHITELIST = ["__main__"]
     BLACKLIST = ["numpy", "typing", "typing.io", "typing_extensions", "ray"]
+    # Frozenset mirror of BLACKLIST: traversal passes this to
+    # should_skip_prefix so the per-node membership check is O(1).
+    _BLACKLIST = frozenset(BLACKLIST)
+    # torch subtrees worth traversing; everything else under torch is skipped
+    # (torchvision/torchaudio are separate packages and unaffected).
+    _TORCH_ALLOWED_PREFIXES = (
+        "torch.nn",
+        "torch.cuda",
+        "torch.distributed",
+        "torch.optim",
+    )
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def create_filter(prefix: Optional[str]) -> Callable[[str], bool]:
         """Create a filter function based on the prefix pattern.
 
+        Filters are cached per prefix, so repeat queries reuse the same
+        callable (and, for wildcard prefixes, the same compiled pattern)
+        instead of rebuilding them on every call.
+
         Args:
             prefix: String prefix, can contain wildcards (* and ?)
 
@@ -177,8 +268,15 @@ class _TraceableCollector:
         if prefix is None:
             return lambda x: True
         elif "*" in prefix or "?" in prefix:
-            return lambda x: fnmatch.fnmatch(x, prefix)
+            # Compile once here rather than routing every candidate through
+            # fnmatch.fnmatch's per-call normcase and cache lookup.
+            match = re.compile(fnmatch.translate(prefix)).match
+            return lambda x: match(x) is not None
         else:
+            # Literal prefixes never touch the regex machinery: one C-level
+            # startswith per candidate. Wildcard detection deliberately
+            # checks only * and ? to stay in sync with the prune checks in
+            # list_traceable (dotted module names cannot contain [ ]).
             return lambda x: x.startswith(prefix)
 
     @staticmethod
@@ -193,6 +291,11 @@ class _TraceableCollector:
         Returns:
             The object's __name__ if it's a string, None otherwise
         """
+        # Exact classes, functions and modules always carry a string
+        # __name__ and never warn on access; resolve them without paying
+        # for the catch_warnings context below.
+        if type(obj) in _NAMED_TYPES:
+            return obj.__name__
         try:
             with _ignore_torch_reduce_op_deprecation():
                 if hasattr(obj, "__name__"):
@@ -203,6 +306,25 @@ class _TraceableCollector:
             pass
         return None
 
+    @staticmethod
+    def prefix_reachable(module_name: str, prefix: str) -> bool:
+        """Check whether a module subtree can contain paths matching ``prefix``.
+
+        Every path produced under a module starts with ``module_name``, so the
+        subtree is only worth walking when one dotted name is a prefix of the
+        other.
+
+        Args:
+            module_name: Top-level name the subtree is rooted at
+            prefix: Plain (wildcard-free) dotted prefix being queried
+
+        Returns:
+            True if some path under the module could match the prefix
+        """
+        if module_name.startswith(prefix):
+            return True
+        return prefix.startswith(module_name + ".")
+
     @staticmethod
     def should_skip_prefix(prefix: str, blacklist: List[str]) -> bool:
         """Check if a prefix should be skipped based on blacklist and special rules.
@@ -219,13 +341,8 @@ class _TraceableCollector:
 
         # Special handling for torch module (but not torchvision, torchaudio, etc.)
         if prefix == "torch" or prefix.startswith("torch."):
-            allowed_prefixes = (
-                "torch.nn",
-                "torch.cuda",
-                "torch.distributed",
-                "torch.optim",
-            )
-            if not any(prefix.startswith(p) for p in allowed_prefixes):
+            # Tuple-form startswith: one C call instead of a generator loop.
+            if not prefix.startswith(_TraceableCollector._TORCH_ALLOWED_PREFIXES):
                 return True
 
         # Skip six module internals
@@ -244,6 +361,12 @@ class _TraceableCollector:
         Returns:
             A single character string: "F", "C", "M", or "V"
         """
+        # One type() call and one dict probe covers almost every object a
+        # traversal sees, and skips entering the warning-suppression context
+        # (catch_warnings is not free) for those hits.
+        hit = _ITEM_TYPE_MAP.get(type(obj))
+        if hit is not None:
+            return hit
         with _ignore_torch_reduce_op_deprecation():
             if inspect.isfunction(obj) or (
                 isinstance(obj, FunctionType) and hasattr(obj, "__code__")
@@ -261,6 +384,10 @@ class _TraceableCollector:
     ) -> bool:
         """Check if a module should be included in the traceable items.
 
+        The verdict is memoized per (name, module, whitelist): the __spec__
+        probes run once per module, and repeat queries over sys.modules are
+        cache hits.
+
         Args:
             module_name: Name of the module
             module: The module object
@@ -269,25 +396,7 @@ class _TraceableCollector:
         Returns:
             True if the module should be included, False otherwise
         """
-        # Handle whitelist modules
-        if module_name in whitelist:
-            return True
-
-        # Allow probing module
-        if module_name.startswith("probing"):
-            return isinstance(module_name, str) and not module_name.startswith("__")
-
-        # For other modules, check __spec__ and site-packages
-        if not hasattr(module, "__spec__"):
-            return False
-
-        try:
-            if module.__spec__ is None or "site-packages" not in module.__spec__.origin:
-                return False
-        except (AttributeError, TypeError):
-            return False
-
-        return isinstance(module_name, str) and not module_name.startswith("__")
+        return _should_include_module_cached(module_name, module, tuple(whitelist))
 
     @classmethod
     def traverse_object(
@@ -318,21 +427,30 @@ class _TraceableCollector:
                 return
             if current_depth > depth:
                 return
+            if type(obj) in _SKIP_DICT_TYPES:
+                return
 
             travel_history.add(id(obj))
 
             if not hasattr(obj, "__dict__"):
                 return
 
+            # Computed once per node: children only append their own key.
+            pfx = (prefix + ".") if prefix else ""
+
             try:
                 for k, v in obj.__dict__.items():
                     try:
                         if k.startswith("__"):
                             continue
+                        if type(v) in _SKIP_DICT_TYPES:
+                            # Plain values ("V") are never traceable; skip the
+                            # classification machinery entirely.
+                            continue
                         if _should_skip_traversal_attr(prefix, k):
                             continue
 
-                        full_path = f"{prefix}.{k}" if prefix else k
+                        full_path = pfx + k
 
                         # Skip Ray-related attributes that might require connection
                         if "ray" in prefix.lower() or "ray" in k.lower():
@@ -476,9 +594,14 @@ class _TraceableCollector:
                                 ):
                                     # Skip this function if any error occurs
                                     pass
+                                # Item names are interned at ingestion: the
+                                # same dotted paths are hashed and compared by
+                                # every downstream filter/group pass, so
+                                # equality short-circuits on identity and the
+                                # hash is computed once per distinct path.
                                 traceable_items.append(
                                     {
-                                        "name": full_path,
+                                        "name": sys.intern(full_path),
                                         "type": item_type,
                                         "variables": variables,
                                     }
@@ -498,7 +621,7 @@ class _TraceableCollector:
                                     )
                             else:
                                 traceable_items.append(
-                                    {"name": full_path, "type": item_type}
+                                    {"name": sys.intern(full_path), "type": item_type}
                                 )
 
                     except (
@@ -525,13 +648,18 @@ class _TraceableCollector:
             pass
 
     def collect_traceable_items(
-        cls, depth: int, filter_func: Callable[[str], bool]
+        cls,
+        depth: int,
+        filter_func: Callable[[str], bool],
+        prune_prefix: Optional[str] = None,
     ) -> List[Dict]:
         """Collect all traceable items from sys.modules.
 
         Args:
             depth: Maximum recursion depth for traversal
             filter_func: Function to filter paths
+            prune_prefix: Plain dotted prefix; module subtrees that cannot
+                contain a matching path are skipped without traversal
 
         Returns:
             List of traceable items (dicts with 'name' and 'type' keys)
@@ -540,7 +668,9 @@ class _TraceableCollector:
         travel_history = set()
 
         # Check __main__ module first
-        if "__main__" in sys.modules:
+        if "__main__" in sys.modules and (
+            prune_prefix is None or cls.prefix_reachable("__main__", prune_prefix)
+        ):
             main_module = sys.modules["__main__"]
             if isinstance(main_module, ModuleType):
                 cls.traverse_object(
@@ -548,7 +678,7 @@ class _TraceableCollector:
                     "__main__",
                     0,
                     depth,
-                    cls.BLACKLIST,
+                    cls._BLACKLIST,
                     filter_func,
                     traceable_items,
                     travel_history,
@@ -567,13 +697,20 @@ class _TraceableCollector:
                 if module_name.startswith("ray") and module_name != "ray":
                     continue
 
+                # Prune whole subtrees that cannot match a plain prefix before
+                # paying for the attribute walk.
+                if prune_prefix is not None and not cls.prefix_reachable(
+                    module_name, prune_prefix
+                ):
+                    continue
+
                 if cls.should_include_module(module_name, module, cls.WHITELIST):
                     cls.traverse_object(
                         module,
                         module_name,
                         0,
                         depth,
-                        cls.BLACKLIST,
+                        cls._BLACKLIST,
                         filter_func,
                         traceable_items,
                         travel_history,
@@ -609,22 +746,23 @@ class _TraceableCollector:
         Returns:
             Filtered and grouped list of traceable items
         """
+        # No persistent sorted index here on purpose: every query gets a
+        # fresh items list from collect_traceable_items, so a bisect-able
+        # index would be built, used for one O(n) pass, and thrown away —
+        # strictly more work than the single scan below.
         if prefix is None:
-            # Return only top-level modules
-            module_paths = {}
+            # Return only top-level modules: one pass, one dict, and only
+            # the first dotted segment is materialized (partition stops at
+            # the first dot where split would allocate every segment).
+            roots = {}
             for item in traceable_items:
-                func_path = item["name"]
-                parts = func_path.split(".")
-                if len(parts) > 0:
-                    top_level = parts[0]
-                    if top_level not in module_paths:
-                        module_paths[top_level] = {"name": top_level, "type": "M"}
-            return sorted(module_paths.values(), key=lambda x: x["name"])
+                roots[item["name"].partition(".")[0]] = None
+            return [{"name": name, "type": "M"} for name in sorted(roots)]
 
         has_wildcard = "*" in prefix or "?" in prefix
         if has_wildcard:
             # Return all matching paths without truncation
-            return sorted(traceable_items, key=lambda x: x["name"])
+            return sorted(traceable_items, key=_BY_NAME)
 
         # Return paths one level deeper than prefix
         prefix_levels = len(prefix.split("."))
@@ -658,7 +796,7 @@ class _TraceableCollector:
                 if func_path not in module_paths:
                     module_paths[func_path] = item.copy()
 
-        return sorted(module_paths.values(), key=lambda x: x["name"])
+        return sorted(module_paths.values(), key=_BY_NAME)
 
 
 def probe(func, watch=None, silent_watch=None, depth=1):
@@ -759,6 +897,17 @@ def probe(func, watch=None, silent_watch=None, depth=1):
 
 
 class ProbingTracer:
+    __slots__ = (
+        "depth",
+        "count_calls",
+        "count_returns",
+        "watch",
+        "silent_watch",
+        "all_watch",
+        "watch_impl",
+        "_bound_trace",
+    )
+
     def __init__(self, depth=1, watch=None, silent_watch=None):
         self.depth = depth
         self.count_calls = 0
@@ -769,6 +918,9 @@ class ProbingTracer:
         self.silent_watch = list(silent_watch)
         self.all_watch = list(set(self.watch + self.silent_watch))
         self.watch_impl = {}
+        # `self.trace` builds a fresh bound method per access; the callback
+        # is returned once per trace event, so bind it a single time.
+        self._bound_trace = self.trace
 
     def on_call(self):
         self.count_calls += 1
@@ -784,64 +936,93 @@ class ProbingTracer:
         return depth > self.depth
 
     def _is_internal_frame(self, frame):
-        return frame.f_code.co_filename.startswith(internal_directories)
+        filename = frame.f_code.co_filename
+        cached = _internal_filename_cache.get(filename)
+        if cached is None:
+            cached = filename.startswith(internal_directories)
+            _internal_filename_cache[filename] = cached
+        return cached
 
     def __enter__(self):
-        tracer_stack = thread_global.__dict__.setdefault("tracer_stack", [])
+        tracer_stack = _tracer_stack.get()
+        if tracer_stack is None:
+            tracer_stack = []
+            _tracer_stack.set(tracer_stack)
         tracer_stack.append(sys.gettrace())
-        sys.settrace(self.trace)
+        sys.settrace(self._bound_trace)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        tracer_stack = thread_global.tracer_stack
-        sys.settrace(tracer_stack.pop())
+        sys.settrace(_tracer_stack.get().pop())
 
     def trace(self, frame: FrameType, event: AnyStr, arg: Any):
-        import torch
-
         # print(
         #     f"Event: {event}, Frame: {frame}, Arg: {arg}, name: {frame.f_code.co_name}"
         # )
 
         if event == "call":
-            self.on_call()
-            if self._outof_depth():
+            # on_call/_outof_depth inlined: this runs per call event, where
+            # two extra bound-method calls dwarf the arithmetic itself.
+            self.count_calls += 1
+            if (
+                self.depth is not None
+                and self.count_calls - self.count_returns > self.depth
+            ):
                 frame.f_locals["__trace_checkpoint__"] = TracerCheckpoint(
                     self.on_return
                 )
                 return None
             if not self.watch_impl and self.all_watch:
+                f_locals = frame.f_locals
                 self.watch_impl = {
-                    k: id(frame.f_locals.get(k, None)) for k in self.all_watch
+                    k: id(f_locals.get(k, None)) for k in self.all_watch
                 }
-            return self.trace
+            if not self.all_watch:
+                # Nothing watched in this tracer: line events would reach the
+                # no-op tail below for every bytecode line. Suppress them per
+                # frame; call/return still arrive for depth accounting.
+                frame.f_trace_lines = False
+            return self._bound_trace
         if event == "return":
-            self.on_return()
-            for k in self.all_watch:
-                if k in frame.f_locals and isinstance(
-                    frame.f_locals[k], FakeProbingTensor
+            self.count_returns += 1
+            all_watch = self.all_watch
+            if all_watch:
+                import torch
+
+                # frame.f_locals rebuilds its snapshot on every attribute
+                # access; take it once per event.
+                f_locals = frame.f_locals
+                for k in all_watch:
+                    if k in f_locals and isinstance(f_locals[k], FakeProbingTensor):
+                        f_locals[k] = torch.Tensor(f_locals[k])
+                        ctypes.pythonapi.PyFrame_LocalsToFast(
+                            ctypes.py_object(frame), ctypes.c_int(0)
+                        )
+            return self._bound_trace
+        if self._is_internal_frame(frame):
+            return None
+
+        # Per-line hot path: shadow the attributes read in the loops below
+        # (and the f_locals snapshot) into locals so reuse is a LOAD_FAST.
+        f_locals = frame.f_locals
+        all_watch = self.all_watch
+        if all_watch:
+            import torch
+
+            for k in all_watch:
+                if (
+                    k in f_locals
+                    and isinstance(f_locals[k], torch.Tensor)
+                    and (not isinstance(f_locals[k], FakeProbingTensor))
                 ):
-                    frame.f_locals[k] = torch.Tensor(frame.f_locals[k])
+                    f_locals[k] = ProbingTensor(f_locals[k])
                     ctypes.pythonapi.PyFrame_LocalsToFast(
                         ctypes.py_object(frame), ctypes.c_int(0)
                     )
-            return self.trace
-        if self._is_internal_frame(frame):
-            return None
-
-        for k in self.all_watch:
-            if (
-                k in frame.f_locals
-                and isinstance(frame.f_locals[k], torch.Tensor)
-                and (not isinstance(frame.f_locals[k], FakeProbingTensor))
-            ):
-                frame.f_locals[k] = ProbingTensor(frame.f_locals[k])
-                ctypes.pythonapi.PyFrame_LocalsToFast(
-                    ctypes.py_object(frame), ctypes.c_int(0)
-                )
-        for k, v in self.watch_impl.items():
-            if k in frame.f_locals and id(frame.f_locals[k]) != v:
-                new_value = frame.f_locals[k]
+        watch_impl = self.watch_impl
+        for k, v in watch_impl.items():
+            if k in f_locals and id(f_locals[k]) != v:
+                new_value = f_locals[k]
                 # Format: probing: [function:line] variable = value (type)
                 filename = (
                     frame.f_code.co_filename.split("/")[-1]
@@ -884,11 +1065,13 @@ class ProbingTracer:
                         f"Warning: Failed to save variable change to trace_variables table: {e}"
                     )
 
-                self.watch_impl[k] = id(frame.f_locals[k])
-        return self.trace
+                watch_impl[k] = id(f_locals[k])
+        return self._bound_trace
 
 
 class TracerCheckpoint:
+    __slots__ = ("trace", "callback")
+
     def __init__(self, callback=None):
         self.trace = sys.gettrace()
         self.callback = callback
@@ -908,34 +1091,37 @@ __ProbingTensor = None
 
 
 def ProbingTensor(*args, **kwargs):
-    import torch
+    # Torch stays a call-time import so tracing sessions that never touch a
+    # tensor pay nothing for it; the subclass is defined on first use only —
+    # executing a torch.Tensor subclass body per wrapped tensor is not cheap.
+    global __ProbingTensor
+    if __ProbingTensor is None:
+        import torch
 
-    class _ProbingTensor(torch.Tensor, FakeProbingTensor):
-        def __format__(self, format_spec):
-            return f"{self.item().__format__(format_spec)}"
+        class _ProbingTensor(torch.Tensor, FakeProbingTensor):
+            def __format__(self, format_spec):
+                return f"{self.item().__format__(format_spec)}"
 
-        @classmethod
-        def __torch_function__(cls, func, types, args=(), kwargs=None):
-            if kwargs is None:
-                kwargs = {}
-            if (
-                func is not torch.Tensor.__repr__
-                # and func is not torch.Tensor.__format__
-                and func is not torch.Tensor.__str__
-                and func.__name__.endswith("_")
-                and not func.__name__.startswith("__")
-            ):
-                old_val = f"{args}"
-                ret = super().__torch_function__(func, types, args, kwargs)
-                ret_val = f"{args}"
-                _trace_emit(
-                    f"probing: tensor update with {func.__name__}: {old_val} => {ret_val}"
-                )
-                return ret
-            return super().__torch_function__(func, types, args, kwargs)
+            @classmethod
+            def __torch_function__(cls, func, types, args=(), kwargs=None):
+                if kwargs is None:
+                    kwargs = {}
+                if (
+                    func is not torch.Tensor.__repr__
+                    # and func is not torch.Tensor.__format__
+                    and func is not torch.Tensor.__str__
+                    and func.__name__.endswith("_")
+                    and not func.__name__.startswith("__")
+                ):
+                    old_val = f"{args}"
+                    ret = super().__torch_function__(func, types, args, kwargs)
+                    ret_val = f"{args}"
+                    _trace_emit(
+                        f"probing: tensor update with {func.__name__}: {old_val} => {ret_val}"
+                    )
+                    return ret
+                return super().__torch_function__(func, types, args, kwargs)
 
-    global __ProbingTensor
-    if __ProbingTensor is None:
         __ProbingTensor = _ProbingTensor
     return __ProbingTensor(*args, **kwargs)
 
@@ -974,7 +1160,12 @@ def list_traceable(prefix=None, depth=2):
     depth = max(0, min(int(depth), MAX_LIST_TRACEABLE_DEPTH))
     collector = _TraceableCollector()
     filter_func = collector.create_filter(prefix)
-    traceable_items = collector.collect_traceable_items(depth, filter_func)
+    prune_prefix = (
+        prefix if prefix is not None and "*" not in prefix and "?" not in prefix else None
+    )
+    traceable_items = collector.collect_traceable_items(
+        depth, filter_func, prune_prefix=prune_prefix
+    )
     traceable_items = collector.filter_by_prefix(traceable_items, prefix)
 
     # Always return structured data with variables
@@ -1004,6 +1195,44 @@ def getname(obj):
     return _TraceableCollector.get_object_name(obj)
 
 
+# name -> (parent, leaf_attr) for successfully resolved dotted trace targets.
+# Parents (modules/classes) are long-lived; the leaf is re-fetched per call so
+# repeated trace/untrace cycles skip the attribute walk but never see a stale
+# function object. Only successful resolutions are cached — a module that is
+# not imported yet may appear later.
+_resolve_cache: Dict[str, tuple] = {}
+_RESOLVE_CACHE_MAX = 1024
+
+
+def _resolve_parent(name: str):
+    cached = _resolve_cache.get(name)
+    if cached is not None:
+        return cached
+    names = name.split(".")
+    parent = sys.modules.get(names[0], None)
+    if parent is None or len(names) < 2:
+        return None
+    for attr in names[1:-1]:
+        if not hasattr(parent, attr):
+            raise ValueError(f"{attr} not found in {parent}.")
+        parent = getattr(parent, attr)
+    if len(_resolve_cache) >= _RESOLVE_CACHE_MAX:
+        _resolve_cache.clear()
+    resolved = (parent, names[-1])
+    _resolve_cache[name] = resolved
+    return resolved
+
+
+def _get_func(name: str):
+    resolved = _resolve_parent(name)
+    if resolved is None:
+        return None
+    parent, leaf = resolved
+    if not hasattr(parent, leaf):
+        raise ValueError(f"{leaf} not found in {parent}.")
+    return getattr(parent, leaf)
+
+
 def trace(
     func_or_name,
     watch=None,
@@ -1011,26 +1240,17 @@ def trace(
     depth=1,
     callback=None,
 ):
-    def get_func(name):
-        names = name.split(".")
-        parent = sys.modules.get(names[0], None)
-        names = names[1:]
-        while parent is not None and len(names) > 0:
-            if hasattr(parent, names[0]):
-                if len(names) == 1:
-                    return getattr(parent, names[0])
-                parent = getattr(parent, names[0])
-                names = names[1:]
-            else:
-                raise ValueError(f"{names[0]} not found in {parent}.")
-
     if watch is None:
         watch = []
     if silent_watch is None:
         silent_watch = []
 
     if isinstance(func_or_name, str):
+        global _show_trace_cache
         _validate_trace_name(func_or_name)
+        # Interned keys let the membership probes here and in untrace()
+        # short-circuit on pointer equality across trace/untrace cycles.
+        func_or_name = sys.intern(func_or_name)
         if depth is None:
             depth = 1
         depth = max(0, min(int(depth), MAX_TRACE_DEPTH))
@@ -1038,7 +1258,7 @@ def trace(
             _trace_warn(f"Function {func_or_name} is already being traced.")
             return
         try:
-            func = get_func(func_or_name)
+            func = _get_func(func_or_name)
             if not isinstance(func, FunctionType):
                 _trace_warn(f"Error: {func_or_name} is not a function")
                 return
@@ -1054,6 +1274,7 @@ def trace(
                 "__code_id__": id(func.__code__),  # Store original code_id for cleanup
             }
             traced_functions[func_or_name] = original_attrs
+            _show_trace_cache = None
 
             # Create a copy of the original function to avoid recursion
             # When we replace func.__code__, the func object itself is modified
@@ -1143,32 +1364,22 @@ def trace(
 
 
 def untrace(func_or_name):
-    def get_func(name):
-        names = name.split(".")
-        parent = sys.modules.get(names[0], None)
-        names = names[1:]
-        while parent is not None and len(names) > 0:
-            if hasattr(parent, names[0]):
-                if len(names) == 1:
-                    return getattr(parent, names[0])
-                parent = getattr(parent, names[0])
-                names = names[1:]
-            else:
-                raise ValueError(f"{names[0]} not found in {parent}.")
-
     if isinstance(func_or_name, str):
+        global _show_trace_cache
         _validate_trace_name(func_or_name)
+        func_or_name = sys.intern(func_or_name)
         if func_or_name not in traced_functions:
             _trace_warn(f"Function {func_or_name} is not being traced.")
             return
         try:
-            func = get_func(func_or_name)
+            func = _get_func(func_or_name)
             if not isinstance(func, FunctionType):
                 _trace_warn(f"Error: {func_or_name} is not a function")
                 return
 
             # Get original attributes
             original_attrs = traced_functions.pop(func_or_name)
+            _show_trace_cache = None
 
             # Clean up _probe_attrs entries for all code_ids associated with this function
             traced_code_ids = original_attrs.get("__traced_code_ids__", [])
@@ -1202,4 +1413,7 @@ def untrace(func_or_name):
 
 
 def show_trace():
-    return json.dumps([x for x in traced_functions.keys()], indent=2)
+    global _show_trace_cache
+    if _show_trace_cache is None:
+        _show_trace_cache = json.dumps(list(traced_functions), indent=2)
+    return _show_trace_cache
@@ -10,6 +10,8 @@ import os
 import sys
 
 from probing._entrypoint import (
+    FOLLOWED_TOKENS,
+    NESTED_TOKENS,
     current_script_name,
     is_elastic_supervisor,
     is_lightweight_module,
@@ -36,11 +38,12 @@ def run_site_hook() -> None:
 
 
 def _init_probing() -> None:
-    probe_value = os.environ.get("PROBING", "0")
+    raw = os.environ.get("PROBING")
+    probe_value = raw if raw is not None else "0"
     script_init: str | None = None
 
-    if "PROBING" in os.environ:
-        os.environ["PROBING_ORIGINAL"] = os.environ["PROBING"]
+    if raw is not None and os.environ.get("PROBING_ORIGINAL") != raw:
+        os.environ["PROBING_ORIGINAL"] = raw
 
     if probe_value.startswith("init:"):
         parts = probe_value.split("+", 1)
@@ -48,65 +51,68 @@ def _init_probing() -> None:
         probe_value = parts[1] if len(parts) > 1 else "0"
 
     current_script = current_script_name()
+    pv_lower = probe_value.lower()
+    # Value PROBING should hold after the hook; None means unset (the
+    # single env write happens at the end instead of per branch).
+    final: str | None = None
 
     try:
-        if "PROBING" in os.environ:
-            del os.environ["PROBING"]
-
-        if probe_value.lower() in ("1", "followed"):
-            print(
+        if pv_lower in FOLLOWED_TOKENS:
+            _activate(
                 "Activating probing in 'followed' mode (current process only)",
-                file=sys.stderr,
+                script_init,
             )
-            import probing  # noqa: F401
-
-            _execute_init_script(script_init)
-            _install_crash_handler()
 
-        elif probe_value.lower() in ("2", "nested"):
-            print(
+        elif pv_lower in NESTED_TOKENS:
+            final = probe_value
+            _activate(
                 "Activating probing in 'nested' mode (all child processes)",
-                file=sys.stderr,
+                script_init,
             )
-            import probing  # noqa: F401
-
-            os.environ["PROBING"] = probe_value
-            _execute_init_script(script_init)
-            _install_crash_handler()
 
-        elif probe_value.lower().startswith("regex:"):
+        elif pv_lower.startswith("regex:"):
             pattern = probe_value.split(":", 1)[1]
             try:
                 if should_activate_probing():
-                    print(
+                    _activate(
                         f"Activating probing for script matching '{pattern}'",
-                        file=sys.stderr,
+                        script_init,
                     )
-                    import probing  # noqa: F401
-
-                    _execute_init_script(script_init)
-                    _install_crash_handler()
-                os.environ["PROBING"] = probe_value
+                final = probe_value
             except Exception as exc:
                 print(f"Error in regex pattern '{pattern}': {exc}", file=sys.stderr)
 
         elif probe_value != "0":
             if probe_value == current_script:
-                print(
+                _activate(
                     f"Activating probing for '{current_script}' (current process only)",
-                    file=sys.stderr,
+                    script_init,
                 )
-                import probing  # noqa: F401
-
-                _execute_init_script(script_init)
-                _install_crash_handler()
-            os.environ["PROBING"] = probe_value
+            final = probe_value
 
     except ImportError as exc:
         print(f"Error loading probing library: {exc}", file=sys.stderr)
     except Exception as exc:
         print(f"Unexpected error in probing site hook: {exc}", file=sys.stderr)
 
+    if final is None:
+        os.environ.pop("PROBING", None)
+    else:
+        os.environ["PROBING"] = final
+
+
+def _activate(message: str, script_init: str | None) -> None:
+    """Announce activation, import the engine, and run post-import setup.
+
+    The ``import probing`` lives here so no branch pays for the extension
+    load before its predicate has matched.
+    """
+    print(message, file=sys.stderr)
+    import probing  # noqa: F401
+
+    _execute_init_script(script_init)
+    _install_crash_handler()
+
 
 def _install_crash_handler() -> None:
     try:
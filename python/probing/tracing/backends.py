@@ -13,21 +13,45 @@ Environment
 ``PROBING_SPAN_LOG_LEVEL``
     Log level for the ``logger`` backend (default: ``INFO``).
 
+``PROBING_SPAN_BUFFERED``
+    When truthy, the ``memtable`` backend batches rows through a bounded
+    buffer drained by a background thread instead of saving each row on the
+    application thread (default: off).
+
+``PROBING_SPAN_BUFFER_SIZE``
+    Buffer capacity in rows for ``PROBING_SPAN_BUFFERED`` (default: 4096).
+    When the buffer is full, rows fall back to synchronous saves.
+
 ``OTEL_EXPORTER_OTLP_ENDPOINT`` / standard OTel env vars apply when ``otel`` is enabled.
 """
 
 from __future__ import annotations
 
+import atexit
+import collections
 import json
 import logging
 import os
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Protocol, runtime_checkable
 
+from probing.util.env import parse_bool_flag
+
 logger = logging.getLogger(__name__)
 
+# Hot-path bindings: one global load instead of module attribute lookups.
+_time_ns = time.time_ns
+_json_dumps = json.dumps
+
+# Interned row tags: every TraceEvent row carries one of these, so reuse the
+# same string objects instead of materializing per-row literals.
+_RT_SPAN_START = sys.intern("span_start")
+_RT_SPAN_END = sys.intern("span_end")
+_RT_EVENT = sys.intern("event")
+
 MEMTABLE_BACKEND = "memtable"
 LOGGER_BACKEND = "logger"
 OTEL_BACKEND = "otel"
@@ -49,7 +73,9 @@ class SpanStartRecord:
     time_ns: int
     thread_id: int
     location: str
-    attributes_json: str
+    # Raw attribute dict; backends that need JSON serialize it themselves so
+    # dict-native consumers (logger/otel) skip a dumps -> loads round trip.
+    attributes: Dict[str, Any]
 
 
 @dataclass(frozen=True)
@@ -75,7 +101,7 @@ class SpanEventRecord:
     name: str
     time_ns: int
     thread_id: int
-    event_attributes_json: str
+    event_attributes: Dict[str, Any]
 
 
 @runtime_checkable
@@ -212,6 +238,138 @@ def load_backends(names: Optional[List[str]] = None) -> List[SpanBackend]:
     return out
 
 
+_ENV_BUFFERED = "PROBING_SPAN_BUFFERED"
+_ENV_BUFFER_SIZE = "PROBING_SPAN_BUFFER_SIZE"
+_DEFAULT_BUFFER_SIZE = 4096
+_MAX_FLUSH_BATCH = 256
+
+
+def span_buffering_enabled() -> bool:
+    """Return whether memtable span rows are written via the batch buffer."""
+    return bool(parse_bool_flag(os.environ.get(_ENV_BUFFERED)))
+
+
+def _buffer_maxsize() -> int:
+    raw = os.environ.get(_ENV_BUFFER_SIZE)
+    if raw is None:
+        return _DEFAULT_BUFFER_SIZE
+    try:
+        size = int(raw)
+    except (TypeError, ValueError):
+        return _DEFAULT_BUFFER_SIZE
+    return max(1, size)
+
+
+class _BatchedRowWriter:
+    """Bounded record buffer drained to ``append_rows`` by a daemon thread.
+
+    Span boundaries only pay for a deque append of a ``(tag, record)`` pair;
+    row-tuple construction, attribute JSON serialization, and the table
+    round trip all happen in batches off the hot thread (flight-recorder
+    pattern, same shape as ``profiling.deferred_drain``).
+
+    ``collections.deque.append``/``popleft`` are GIL-atomic, so producers
+    never touch a lock the consumer might hold — the ring equivalent of a
+    lock-free SPSC queue under the GIL.
+    """
+
+    def __init__(
+        self,
+        trace_event_cls: Any,
+        build: Callable[[str, Any], Any],
+        *,
+        maxsize: int,
+    ) -> None:
+        self._TraceEvent = trace_event_cls
+        self._build = build
+        self._maxsize = maxsize
+        self._buf: collections.deque = collections.deque()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: Optional[threading.Thread] = None
+        self._started = False
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="probing-span-row-writer",
+                daemon=True,
+            )
+            self._thread.start()
+            self._started = True
+            atexit.register(self.shutdown)
+
+    def push(self, tag: str, record: Any) -> bool:
+        """Enqueue a record. Returns False when the buffer is full (caller saves)."""
+        self._ensure_started()
+        if len(self._buf) >= self._maxsize:
+            logger.debug(
+                "span row buffer full (%s slots); falling back to sync save",
+                self._maxsize,
+            )
+            return False
+        self._buf.append((tag, record))
+        self._wakeup.set()
+        return True
+
+    def _run(self) -> None:
+        buf = self._buf
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            stop = False
+            while buf:
+                self._idle.clear()
+                items = []
+                while buf and len(items) < _MAX_FLUSH_BATCH:
+                    item = buf.popleft()
+                    if item is None:
+                        stop = True
+                        break
+                    items.append(item)
+                if items:
+                    try:
+                        batch = [self._build(tag, record) for tag, record in items]
+                        self._TraceEvent.append_rows(batch)
+                    except Exception:
+                        logger.debug("span row flush failed", exc_info=True)
+                if stop:
+                    break
+            self._idle.set()
+            if stop:
+                return
+
+    def flush(self, timeout: Optional[float] = 10.0) -> None:
+        """Block until all buffered rows reach the table."""
+        if not self._started:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._buf or not self._idle.is_set():
+            if deadline is not None and time.monotonic() > deadline:
+                logger.warning(
+                    "span row flush timed out after %.1fs (%s rows still buffered)",
+                    timeout,
+                    len(self._buf),
+                )
+                return
+            self._idle.wait(timeout=0.01)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            if not self._started or self._thread is None:
+                return
+            thread = self._thread
+        self.flush(timeout=timeout)
+        self._buf.append(None)
+        self._wakeup.set()
+        thread.join(timeout=timeout)
+
+
 class MemtableBackend:
     """Canonical store: ``python.trace_event`` mmap rows."""
 
@@ -219,65 +377,98 @@ class MemtableBackend:
 
     def __init__(self, trace_event_cls: Any) -> None:
         self._TraceEvent = trace_event_cls
-
+        self._writer: Optional[_BatchedRowWriter] = None
+        if span_buffering_enabled():
+            self._writer = _BatchedRowWriter(
+                trace_event_cls, self._build_row, maxsize=_buffer_maxsize()
+            )
+
+    # Rows are plain tuples in TraceEvent field order (record_type, trace_id,
+    # span_id, name, time, thread_id, parent_id, phase, location, attributes,
+    # event_attributes); append_rows feeds them to the memtable without a
+    # per-row dataclass round trip.
     def _start_row(self, record: SpanStartRecord):
-        return self._TraceEvent(
-            record_type="span_start",
-            trace_id=record.trace_id,
-            span_id=record.span_id,
-            name=record.name,
-            time=record.time_ns,
-            thread_id=record.thread_id,
-            parent_id=record.parent_id,
-            phase=record.phase,
-            location=record.location,
-            attributes=record.attributes_json,
-            event_attributes="",
+        return (
+            _RT_SPAN_START,
+            record.trace_id,
+            record.span_id,
+            record.name,
+            record.time_ns,
+            record.thread_id,
+            record.parent_id,
+            record.phase,
+            record.location,
+            _json_dumps(record.attributes) if record.attributes else "",
+            "",
         )
 
     def _end_row(self, record: SpanEndRecord):
-        return self._TraceEvent(
-            record_type="span_end",
-            trace_id=0,
-            span_id=record.span_id,
-            name="",
-            time=record.time_ns,
-            thread_id=record.thread_id,
-            parent_id=-1,
-            phase="",
-            location="",
-            attributes="",
-            event_attributes="",
+        return (
+            _RT_SPAN_END,
+            0,
+            record.span_id,
+            "",
+            record.time_ns,
+            record.thread_id,
+            -1,
+            "",
+            "",
+            "",
+            "",
+        )
+
+    def _event_row(self, record: SpanEventRecord):
+        return (
+            _RT_EVENT,
+            record.trace_id,
+            record.span_id,
+            record.name,
+            record.time_ns,
+            record.thread_id,
+            record.parent_id,
+            record.phase,
+            record.location,
+            "",
+            _json_dumps(record.event_attributes) if record.event_attributes else "",
         )
 
+    def _build_row(self, tag: str, record: Any):
+        if tag is _RT_SPAN_START:
+            return self._start_row(record)
+        if tag is _RT_SPAN_END:
+            return self._end_row(record)
+        return self._event_row(record)
+
+    def _emit(self, tag: str, record: Any) -> None:
+        if self._writer is None or not self._writer.push(tag, record):
+            self._TraceEvent.append_rows([self._build_row(tag, record)])
+
     def on_span_start(self, record: SpanStartRecord) -> None:
-        self._start_row(record).save()
+        self._emit(_RT_SPAN_START, record)
 
     def on_span_end(self, record: SpanEndRecord) -> None:
-        self._end_row(record).save()
+        self._emit(_RT_SPAN_END, record)
 
     def on_span_closed(self, record: ClosedSpanRecord) -> None:
-        self._TraceEvent.append_many(
+        if self._writer is not None and self._writer.push(_RT_SPAN_START, record.start):
+            if not self._writer.push(_RT_SPAN_END, record.end):
+                self._TraceEvent.append_rows([self._end_row(record.end)])
+            return
+        self._TraceEvent.append_rows(
             [self._start_row(record.start), self._end_row(record.end)]
         )
 
     def on_event(self, record: SpanEventRecord) -> None:
-        self._TraceEvent(
-            record_type="event",
-            trace_id=record.trace_id,
-            span_id=record.span_id,
-            name=record.name,
-            time=record.time_ns,
-            thread_id=record.thread_id,
-            parent_id=record.parent_id,
-            phase=record.phase,
-            location=record.location,
-            attributes="",
-            event_attributes=record.event_attributes_json,
-        ).save()
+        self._emit(_RT_EVENT, record)
 
     def shutdown(self) -> None:
-        return None
+        if self._writer is not None:
+            self._writer.shutdown()
+
+    def flush(self, timeout: Optional[float] = 10.0) -> None:
+        """Wait for buffered rows to land in the memtable (tests / shutdown)."""
+        if self._writer is not None:
+            self._writer.flush(timeout=timeout)
 
 
 def _terminal_logger() -> logging.Logger:
@@ -311,7 +502,7 @@ class LoggerBackend:
         parts = [f"→ {record.name}"]
         if record.phase:
             parts.append(f"phase={record.phase}")
-        source = _attr_from_json(record.attributes_json, "source")
+        source = record.attributes.get("source")
         if source:
             parts.append(f"source={source}")
         self._log.info("%s%s", self._indent(), " ".join(parts))
@@ -333,13 +524,8 @@ class LoggerBackend:
 
     def on_event(self, record: SpanEventRecord) -> None:
         suffix = ""
-        if record.event_attributes_json:
-            try:
-                parsed = json.loads(record.event_attributes_json)
-                if isinstance(parsed, dict) and parsed:
-                    suffix = " " + json.dumps(parsed, ensure_ascii=False)
-            except json.JSONDecodeError:
-                suffix = f" {record.event_attributes_json}"
+        if record.event_attributes:
+            suffix = " " + json.dumps(record.event_attributes, ensure_ascii=False)
         self._log.info("%s· %s%s", self._indent(), record.name, suffix)
 
     def shutdown(self) -> None:
@@ -347,19 +533,6 @@ class LoggerBackend:
         self._depth = 0
 
 
-def _attr_from_json(raw: str, key: str) -> Optional[str]:
-    if not raw:
-        return None
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
-        return None
-    if not isinstance(parsed, dict):
-        return None
-    value = parsed.get(key)
-    return str(value) if value is not None else None
-
-
 class OtelBackend:
     """Optional OpenTelemetry export (Jaeger/Grafana/OTLP via standard OTel env)."""
 
@@ -398,18 +571,8 @@ class OtelBackend:
             kind=self._kind(record.phase),
             start_time=record.time_ns,
         )
-        if record.attributes_json:
-            try:
-                attrs = json.loads(record.attributes_json)
-                if isinstance(attrs, dict):
-                    for key, value in attrs.items():
-                        otel_span.set_attribute(str(key), value)
-                else:
-                    otel_span.set_attribute(
-                        "probing.attributes", record.attributes_json
-                    )
-            except json.JSONDecodeError:
-                otel_span.set_attribute("probing.attributes", record.attributes_json)
+        for key, value in record.attributes.items():
+            otel_span.set_attribute(str(key), value)
         if record.phase:
             otel_span.set_attribute("probing.phase", record.phase)
         if record.location:
@@ -429,14 +592,7 @@ class OtelBackend:
         otel_span = self._spans.get(record.span_id)
         if otel_span is None:
             return
-        attrs: Dict[str, Any] = {}
-        if record.event_attributes_json:
-            try:
-                parsed = json.loads(record.event_attributes_json)
-                if isinstance(parsed, dict):
-                    attrs = {str(k): v for k, v in parsed.items()}
-            except json.JSONDecodeError:
-                attrs = {"raw": record.event_attributes_json}
+        attrs = {str(k): v for k, v in record.event_attributes.items()}
         otel_span.add_event(record.name, attributes=attrs, timestamp=record.time_ns)
 
     def shutdown(self) -> None:
@@ -490,10 +646,10 @@ class SpanRecorder:
     def record_span_end(self, span: Any) -> None:
         if not self.enabled:
             return
-        end_ts = span.end_timestamp or int(time.time_ns())
         record = SpanEndRecord(
             span_id=int(span.span_id),
-            time_ns=int(end_ts),
+            # Rust __exit__ ends the span unconditionally; end_timestamp is set.
+            time_ns=int(span.end_timestamp),
             thread_id=_thread_id(span),
         )
         self._dispatch("on_span_end", record)
@@ -506,7 +662,7 @@ class SpanRecorder:
         phase: str,
         start_ns: int,
         end_ns: int,
-        attributes_json: str,
+        attributes: Optional[dict] = None,
     ) -> None:
         if not self.enabled:
             return
@@ -519,7 +675,7 @@ class SpanRecorder:
             time_ns=int(start_ns),
             thread_id=_thread_id(span),
             location=_span_location(span),
-            attributes_json=attributes_json,
+            attributes=attributes or {},
         )
         end = SpanEndRecord(
             span_id=int(span.span_id),
@@ -574,20 +730,32 @@ def _span_start_record(span: Any, attrs: dict) -> SpanStartRecord:
         time_ns=int(span.start_timestamp),
         thread_id=_thread_id(span),
         location=_span_location(span),
-        attributes_json=json.dumps(attrs) if attrs else "",
+        attributes=attrs or {},
     )
 
 
+def _flatten_event_attrs(items: Optional[list]) -> Dict[str, Any]:
+    """Merge a heterogeneous attribute list (dicts and/or pairs) into one dict.
+
+    Fast paths first: empty, and the dominant single-dict payload, which
+    copies in C via ``dict()`` without entering the type-check loop.
+    """
+    if not items:
+        return {}
+    if len(items) == 1 and isinstance(items[0], dict):
+        return dict(items[0])
+    attrs: Dict[str, Any] = {}
+    for attr_item in items:
+        if isinstance(attr_item, dict):
+            attrs.update(attr_item)
+        elif isinstance(attr_item, (list, tuple)) and len(attr_item) == 2:
+            attrs[attr_item[0]] = attr_item[1]
+    return attrs
+
+
 def _event_record(
     span: Any, event_name: str, event_attributes: Optional[list]
 ) -> SpanEventRecord:
-    attrs_dict: Dict[str, Any] = {}
-    if event_attributes:
-        for attr_item in event_attributes:
-            if isinstance(attr_item, dict):
-                attrs_dict.update(attr_item)
-            elif isinstance(attr_item, (list, tuple)) and len(attr_item) == 2:
-                attrs_dict[attr_item[0]] = attr_item[1]
     return SpanEventRecord(
         trace_id=int(span.trace_id),
         span_id=int(span.span_id),
@@ -595,9 +763,9 @@ def _event_record(
         phase=_span_phase(span),
         location=_span_location(span),
         name=str(event_name),
-        time_ns=int(time.time_ns()),
+        time_ns=_time_ns(),
         thread_id=_thread_id(span),
-        event_attributes_json=json.dumps(attrs_dict) if attrs_dict else "",
+        event_attributes=_flatten_event_attrs(event_attributes),
     )
 
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import functools
 import inspect
-import json
 import os
 import time
 import warnings
@@ -22,6 +21,23 @@ from probing.tracing.phases import OPTIMIZER, resolve_span
 
 _LOCATION_ENV = frozenset({"1", "true", "yes", "on"})
 
+# Hot-path binding: skip the module attribute lookup per span boundary.
+_time_ns = time.time_ns
+
+# probing.tracing.backends imports lazily (circular import at module load);
+# cache the module after the first resolution.
+_backends = None
+
+
+def _backends_module():
+    global _backends
+    if _backends is None:
+        from probing.tracing import backends
+
+        _backends = backends
+    return _backends
+
+
 # Rust Span cannot hold arbitrary Python attrs; track deferred persistence by id.
 _DEFERRED: dict[int, "_DeferredState"] = {}
 _span_attribute_providers: list[Callable[[], dict]] = []
@@ -52,15 +68,11 @@ def _provider_attrs() -> dict:
 
 
 def _recorder():
-    from probing.tracing.backends import get_recorder
-
-    return get_recorder()
+    return _backends_module().get_recorder()
 
 
 def _persistence_enabled() -> bool:
-    from probing.tracing.backends import persistence_enabled
-
-    return persistence_enabled()
+    return _backends_module().persistence_enabled()
 
 
 def _spawn_span(
@@ -72,11 +84,22 @@ def _spawn_span(
     return Span(name, phase=phase, location=location)
 
 
+# Resolved once at import: the Rust Span method set is fixed, so no per-span
+# hasattr probe (which raises/swallows AttributeError internally).
+_set_initial_attrs = getattr(Span, "_set_initial_attrs", None) if Span else None
+
+
 def _attach_attrs(span_obj: Span, attrs: dict) -> None:
-    if not attrs or not hasattr(span_obj, "_set_initial_attrs"):
+    if not attrs or _set_initial_attrs is None:
         return
+    # attrs is the freshly-merged dict built in __enter__ and never mutated
+    # afterwards, so hand it over without a defensive copy. Conversion can
+    # still fail, though: the Rust side extracts every key as str and
+    # stringifies fallback values, and provider-supplied attrs can violate
+    # either. Degrade to a warning — span entry must never throw into the
+    # traced application.
     try:
-        span_obj._set_initial_attrs(dict(attrs))
+        _set_initial_attrs(span_obj, attrs)
     except Exception as exc:
         warnings.warn(f"Failed to set initial attributes: {exc}")
 
@@ -84,6 +107,21 @@ def _attach_attrs(span_obj: Span, attrs: dict) -> None:
 class _RecordedSpan:
     """Context manager: span stack + backend persistence on close."""
 
+    __slots__ = (
+        "name",
+        "phase",
+        "location",
+        "attrs",
+        "source",
+        "_auto_location",
+        "_span",
+        "_reentrant",
+        "_owns_step_advance",
+        "_persist",
+        "_merged",
+        "_span_id",
+    )
+
     def __init__(
         self,
         name: str,
@@ -105,6 +143,8 @@ class _RecordedSpan:
         self._owns_step_advance = False
         self._persist = False
         self._merged: dict = {}
+        # span_id snapshot taken at enter; saves an FFI getter at exit.
+        self._span_id = 0
 
     def __enter__(self) -> Span:
         if self.phase == OPTIMIZER:
@@ -119,11 +159,14 @@ class _RecordedSpan:
             location = _caller_location()
 
         self._persist = _persistence_enabled()
-        merged_attrs = dict(_provider_attrs())
-        merged_attrs.update(self.attrs)
-        self._merged = (
-            span_attrs(merged_attrs, source=self.source) if self._persist else {}
-        )
+        if self._persist:
+            merged_attrs = dict(_provider_attrs())
+            merged_attrs.update(self.attrs)
+            self._merged = span_attrs(merged_attrs, source=self.source)
+        else:
+            # Merged attrs only feed persistence; skip provider calls and
+            # dict churn entirely when no backend is recording.
+            self._merged = {}
 
         span_obj = _spawn_span(self.name, self.phase, location=location)
         _attach_attrs(span_obj, self._merged)
@@ -131,7 +174,8 @@ class _RecordedSpan:
         self._span = span_obj
 
         if self._persist:
-            _DEFERRED[int(span_obj.span_id)] = _DeferredState(merged=self._merged)
+            self._span_id = int(span_obj.span_id)
+            _DEFERRED[self._span_id] = _DeferredState(merged=self._merged)
         if self.phase == OPTIMIZER:
             self._owns_step_advance = True
         return span_obj
@@ -141,7 +185,7 @@ class _RecordedSpan:
             return False
 
         result = self._span.__exit__(exc_type, exc_val, exc_tb)
-        state = _DEFERRED.pop(int(self._span.span_id), None)
+        state = _DEFERRED.pop(self._span_id, None) if self._persist else None
         if state is not None:
             _persist_on_close(self._span, state)
         if self._owns_step_advance:
@@ -152,6 +196,16 @@ class _RecordedSpan:
 class _SpanHandle:
     """Deferred ``probing.span()`` entry (context manager or decorator)."""
 
+    __slots__ = (
+        "_name",
+        "_phase",
+        "_location",
+        "_attrs",
+        "_source",
+        "_auto_location",
+        "_inner",
+    )
+
     def __init__(
         self,
         name: str,
@@ -258,21 +312,23 @@ def span(*args, **kwargs):
     """
     phase_kw, source, location, attrs, auto_location = _parse_span_kwargs(dict(kwargs))
 
+    if len(args) == 1:
+        arg = args[0]
+        # Dominant usage is `with span("name")`; take the exact-str fast path
+        # before probing the decorator/callable forms.
+        if type(arg) is str or isinstance(arg, str):
+            name, phase = resolve_span(arg, phase_kw)
+            return _handle(name, phase, location, attrs, source, auto_location)
+        if callable(arg):
+            name, phase = resolve_span(arg.__name__, phase_kw)
+            return _handle(name, phase, location, attrs, source, auto_location)(arg)
+        raise TypeError(
+            f"span() first argument must be str or callable, got {type(arg).__name__}"
+        )
+
     if len(args) > 1:
         raise TypeError("span() takes at most one positional argument")
 
-    if len(args) == 1 and callable(args[0]):
-        name, phase = resolve_span(args[0].__name__, phase_kw)
-        return _handle(name, phase, location, attrs, source, auto_location)(args[0])
-
-    if len(args) == 1:
-        if not isinstance(args[0], str):
-            raise TypeError(
-                f"span() first argument must be str or callable, got {type(args[0]).__name__}"
-            )
-        name, phase = resolve_span(args[0], phase_kw)
-        return _handle(name, phase, location, attrs, source, auto_location)
-
     if phase_kw is not None:
         name, phase = resolve_span(None, phase_kw)
         return _handle(name, phase, location, attrs, source, auto_location)
@@ -310,7 +366,7 @@ def record_span(
 
     duration_ns = max(duration_ns, 0)
     merged = span_attrs(dict(attrs or {}), source=source)
-    end_ns = int(time.time_ns())
+    end_ns = _time_ns()
     start_ns = end_ns - duration_ns
     resolved_name, resolved_phase = resolve_span(name, phase)
 
@@ -321,7 +377,7 @@ def record_span(
         phase=resolved_phase or "",
         start_ns=start_ns,
         end_ns=end_ns,
-        attributes_json=json.dumps(merged) if merged else "",
+        attributes=merged,
     )
 
 
@@ -358,8 +414,9 @@ def _persist_closed(span: Span, attrs: dict) -> None:
         name=str(span.name),
         phase=str(phase),
         start_ns=int(span.start_timestamp),
-        end_ns=int(span.end_timestamp or time.time_ns()),
-        attributes_json=json.dumps(attrs) if attrs else "",
+        # Rust __exit__ ends the span unconditionally; end_timestamp is set.
+        end_ns=int(span.end_timestamp),
+        attributes=attrs,
     )
 
 
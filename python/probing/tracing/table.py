@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 from probing.core.table import table
 
+# dataclass(slots=True) is 3.10+; an explicit __slots__ clashes with the
+# defaulted fields below, so older runtimes (requires-python is >=3.7)
+# simply keep the regular __dict__ layout and lose only the memory win.
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS = {"slots": True}
+else:
+    _DATACLASS_KWARGS = {}
+
 # Materialized span rows derived from ``python.trace_event`` (start/end join).
 # Use span ``time`` (ns since epoch), not the memtable ingestion ``timestamp``.
 SPANS_SQL = """
@@ -30,11 +39,13 @@ WHERE s.record_type = 'span_start'
 
 
 @table
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class TraceEvent:
     """Row model for trace records.
 
     Each saved instance is one of: span_start, span_end, event.
+    One instance is built per span boundary, so keep it __dict__-free
+    where the runtime allows (see _DATACLASS_KWARGS).
     """
 
     record_type: str
@@ -13,6 +13,10 @@ def _get_ray():
         ) from exc
 
 
+# Sentinel distinguishing "key absent" from a stored None.
+_MISSING = object()
+
+
 def _get_attr(obj, key, default=None):
     """Get attribute from mapping or object, trying multiple keys.
 
@@ -58,12 +62,59 @@ def _get_attr(obj, key, default=None):
     """
     keys = key if isinstance(key, (list, tuple)) else [key]
 
-    for k in keys:
-        if isinstance(obj, dict):
-            if k in obj:
-                return obj[k]
-        else:
-            if hasattr(obj, k):
+    if isinstance(obj, dict):
+        for k in keys:
+            v = obj.get(k, _MISSING)
+            if v is not _MISSING:
+                return v
+    else:
+        for k in keys:
+            try:
                 return getattr(obj, k)
+            except AttributeError:
+                pass
 
     return default
+
+
+def make_get_attr(keys, default=None):
+    """Build a getter with ``keys`` pre-parsed (see ``_get_attr``).
+
+    Call sites that probe the same candidate keys on many objects pay the
+    key normalization once here instead of on every lookup.
+
+    >>> get_id = make_get_attr(["worker_id", "id"], default="")
+    >>> get_id({"id": "w1"})
+    'w1'
+    >>> get_id({})
+    ''
+
+    Parameters
+    ----------
+    keys : str | list[str]
+        Single key/name or a list of candidates to try in order.
+    default : Any, optional
+        Fallback value if none of the keys are found.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        ``getter(obj)`` equivalent to ``_get_attr(obj, keys, default)``.
+    """
+    keys = list(keys) if isinstance(keys, (list, tuple)) else [keys]
+
+    def getter(obj):
+        if isinstance(obj, dict):
+            for k in keys:
+                v = obj.get(k, _MISSING)
+                if v is not _MISSING:
+                    return v
+        else:
+            for k in keys:
+                try:
+                    return getattr(obj, k)
+                except AttributeError:
+                    pass
+        return default
+
+    return getter
@@ -8,27 +8,26 @@ except ImportError:
     config_available = False
 
 
+# Bare keys set by this module in addition to the test.* namespace.
+_TEST_KEYS = frozenset({"str", "int", "float", "bool", "none", "a.key", "b.key", "c.key"})
+
+
 def _clear_test_keys() -> None:
-    """Remove test.* keys used by this module."""
+    """Remove test keys used by this module in a single batch FFI call."""
     import probing
 
-    for key in list(probing.config.keys()):
-        if key.startswith("test.") or key in {
-            "str",
-            "int",
-            "float",
-            "bool",
-            "none",
-            "a.key",
-            "b.key",
-            "c.key",
-        }:
-            probing.config.remove(key)
-
-
-@pytest.fixture
+    stale = [
+        key
+        for key in probing.config.keys()
+        if key.startswith("test.") or key in _TEST_KEYS
+    ]
+    if stale:
+        probing.config.remove_many(stale)
+
+
+@pytest.fixture(scope="module", autouse=True)
 def clear_config():
-    """Clear test configuration before and after each test."""
+    """Clear leftover test keys once around the whole module."""
     if config_available:
         try:
             _clear_test_keys()
@@ -1,292 +1,158 @@
 """Tests for probing initialization and environment variable handling."""
 
+import json
 import os
 import subprocess
 import sys
-import tempfile
 
+import pytest
 
-def test_should_enable_probing_function_direct():
-    """Test should_enable_probing function directly."""
-    # This test requires the function to be accessible
-    # We'll test via subprocess to ensure clean environment
+from probing import _core
 
-    # Get the absolute path to the python directory
-    test_file_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(test_file_dir))
-    python_dir = os.path.join(project_root, "python")
 
-    test_code = f"""
-import os
-import sys
-# Add python directory to path using absolute path
-sys.path.insert(0, r'{python_dir}')
-from probing import _core
+# Checkout python/ dir, so subprocesses can import probing without an
+# installed wheel (harmless when one is installed).
+_PYTHON_DIR = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")),
+    "python",
+)
+
+
+def _subprocess_env(**overrides):
+    """os.environ minus PROBING*, with the checkout on PYTHONPATH."""
+    env = {
+        k: v for k, v in os.environ.items() if k not in ("PROBING", "PROBING_ORIGINAL")
+    }
+    if "PYTHONPATH" in env:
+        env["PYTHONPATH"] = f"{_PYTHON_DIR}:{env['PYTHONPATH']}"
+    else:
+        env["PYTHONPATH"] = _PYTHON_DIR
+    env.update(overrides)
+    return env
+
+
+@pytest.fixture(scope="session")
+def probing_runner(tmp_path_factory):
+    """Shared subprocess runner: one temp script and one precomputed env.
+
+    Returns ``run(**env_overrides)``; the script's basename is available as
+    ``run.script_name`` for the script-name activation test.
+    """
+    script = tmp_path_factory.mktemp("probing") / "probe.py"
+    script.write_text(
+        "import probing\n"
+        "print('enabled' if probing.is_enabled() else 'disabled')\n"
+    )
+    base_env = _subprocess_env()
 
-# Clean environment variables first
-if 'PROBING' in os.environ:
-    del os.environ['PROBING']
-if 'PROBING_ORIGINAL' in os.environ:
-    del os.environ['PROBING_ORIGINAL']
-
-# Test with PROBING not set
-result1 = _core.should_enable_probing()
-print(f'PROBING not set: {{result1}}')
-
-# Test with PROBING=0
-os.environ['PROBING'] = '0'
-result2 = _core.should_enable_probing()
-print(f'PROBING=0: {{result2}}')
-
-# Test with PROBING=1
-os.environ['PROBING'] = '1'
-result3 = _core.should_enable_probing()
-print(f'PROBING=1: {{result3}}')
-
-# Test with PROBING=followed
-os.environ['PROBING'] = 'followed'
-result4 = _core.should_enable_probing()
-print(f'PROBING=followed: {{result4}}')
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(test_code)
-        script_path = f.name
-
-    try:
-        env = os.environ.copy()
-        # Clean environment variables for this test
-        if "PROBING" in env:
-            del env["PROBING"]
-        if "PROBING_ORIGINAL" in env:
-            del env["PROBING_ORIGINAL"]
-        # Set PYTHONPATH to include python directory as backup
-        if "PYTHONPATH" in env:
-            env["PYTHONPATH"] = f"{python_dir}:{env['PYTHONPATH']}"
-        else:
-            env["PYTHONPATH"] = python_dir
-
-        result = subprocess.run(
-            [sys.executable, script_path],
-            env=env,
+    def run(**env):
+        return subprocess.run(
+            [sys.executable, str(script)],
+            env={**base_env, **env},
             capture_output=True,
             text=True,
-            cwd=os.path.dirname(script_path),
         )
 
-        output = result.stdout + result.stderr
-        assert "PROBING not set: False" in output
-        assert "PROBING=0: False" in output
-        assert "PROBING=1: True" in output
-        assert "PROBING=followed: True" in output
-    finally:
-        os.unlink(script_path)
-
-
-def test_should_enable_probing_disabled_by_default():
-    """Test that probing is disabled when PROBING is not set or set to '0'."""
-    # Test with PROBING not set
-    env = os.environ.copy()
-    # Clean environment variables
-    if "PROBING" in env:
-        del env["PROBING"]
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-    assert "disabled" in result.stdout or "disabled" in result.stderr
-
-    # Test with PROBING=0
-    env["PROBING"] = "0"
-    # Also set PROBING_ORIGINAL to test the fallback logic
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-    assert "disabled" in result.stdout or "disabled" in result.stderr
-
-
-def test_should_enable_probing_with_value_1():
-    """Test that probing is enabled when PROBING=1."""
-    env = os.environ.copy()
-    # Clean environment variables first
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    env["PROBING"] = "1"
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-    # Note: This will be 'disabled' if the library is not found, but the check should pass
-    # We're mainly testing that the environment variable check works
-
-
-def test_should_enable_probing_with_value_followed():
-    """Test that probing is enabled when PROBING=followed."""
-    env = os.environ.copy()
-    # Clean environment variables first
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    env["PROBING"] = "followed"
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-
-
-def test_should_enable_probing_with_value_2():
-    """Test that probing is enabled when PROBING=2."""
-    env = os.environ.copy()
-    # Clean environment variables first
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    env["PROBING"] = "2"
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
+    run.script_name = script.name
+    return run
+
+
+@pytest.fixture
+def clean_probing_env(monkeypatch):
+    """Ensure neither PROBING nor PROBING_ORIGINAL leaks into a test."""
+    monkeypatch.delenv("PROBING", raising=False)
+    monkeypatch.delenv("PROBING_ORIGINAL", raising=False)
+    return monkeypatch
+
+
+def test_should_enable_probing_unset(clean_probing_env):
+    """Probing is disabled when PROBING is not set."""
+    assert _core.should_enable_probing() is False
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("0", False),
+        ("1", True),
+        ("followed", True),
+        ("2", True),
+        ("nested", True),
+    ],
+)
+def test_should_enable_probing_values(clean_probing_env, monkeypatch, value, expected):
+    """Table-driven check of the documented PROBING mode values."""
+    monkeypatch.setenv("PROBING", value)
+    assert _core.should_enable_probing() is expected
+
+
+def test_probing_original_takes_precedence(clean_probing_env, monkeypatch):
+    """PROBING_ORIGINAL wins over PROBING (set by the site hook)."""
+    monkeypatch.setenv("PROBING", "0")
+    monkeypatch.setenv("PROBING_ORIGINAL", "1")
+    assert _core.should_enable_probing() is True
+
+
+def test_should_enable_probing_with_init_prefix(clean_probing_env, monkeypatch):
+    """The mode after ``init:<script>+`` decides activation."""
+    monkeypatch.setenv("PROBING", "init:/path/to/script.py+1")
+    assert _core.should_enable_probing() is True
+
+
+def test_should_enable_probing_with_init_prefix_no_setting(
+    clean_probing_env, monkeypatch
+):
+    """``init:`` without a trailing mode defaults to disabled."""
+    monkeypatch.setenv("PROBING", "init:/path/to/script.py")
+    assert _core.should_enable_probing() is False
+
+
+def test_should_enable_probing_subprocess_smoke(tmp_path):
+    """End-to-end check in a fresh interpreter: all values in one fork."""
+    driver = tmp_path / "driver.py"
+    driver.write_text(
+        "import json\n"
+        "import os\n"
+        "import sys\n"
+        "os.environ.pop('PROBING', None)\n"
+        "os.environ.pop('PROBING_ORIGINAL', None)\n"
+        "from probing import _core\n"
+        "report = {'<unset>': _core.should_enable_probing()}\n"
+        "for value in json.loads(sys.argv[1]):\n"
+        "    os.environ['PROBING'] = value\n"
+        "    report[value] = _core.should_enable_probing()\n"
+        "print(json.dumps(report))\n"
     )
 
-
-def test_should_enable_probing_with_value_nested():
-    """Test that probing is enabled when PROBING=nested."""
-    env = os.environ.copy()
-    # Clean environment variables first
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    env["PROBING"] = "nested"
+    expected = {
+        "<unset>": False,
+        "0": False,
+        "1": True,
+        "followed": True,
+        "2": True,
+        "nested": True,
+    }
+    values = [v for v in expected if v != "<unset>"]
 
     result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
+        [sys.executable, str(driver), json.dumps(values)],
+        env=_subprocess_env(),
         capture_output=True,
         text=True,
     )
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == expected
 
 
-def test_should_enable_probing_with_script_name():
+def test_should_enable_probing_with_script_name(probing_runner):
     """Test that probing is enabled when PROBING matches script name."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        script_name = os.path.basename(f.name)
-        f.write("import probing\n")
-        f.write("print('enabled' if probing._library_loaded else 'disabled')\n")
-        script_path = f.name
-
-    try:
-        env = os.environ.copy()
-        # Clean environment variables first
-        if "PROBING_ORIGINAL" in env:
-            del env["PROBING_ORIGINAL"]
-        env["PROBING"] = script_name
-
-        result = subprocess.run(
-            [sys.executable, script_path], env=env, capture_output=True, text=True
-        )
-        # The check should pass (even if library not found, the env check should work)
-    finally:
-        os.unlink(script_path)
+    result = probing_runner(PROBING=probing_runner.script_name)
+    assert result.returncode == 0, result.stderr
+    assert "enabled" in result.stdout
 
 
-def test_should_enable_probing_with_regex():
+def test_should_enable_probing_with_regex(probing_runner):
     """Test that probing is enabled when PROBING matches script name via regex."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("import probing\n")
-        f.write("print('enabled' if probing._library_loaded else 'disabled')\n")
-        script_path = f.name
-
-    try:
-        env = os.environ.copy()
-        # Clean environment variables first
-        if "PROBING_ORIGINAL" in env:
-            del env["PROBING_ORIGINAL"]
-        env["PROBING"] = "regex:.*\\.py$"
-
-        result = subprocess.run(
-            [sys.executable, script_path], env=env, capture_output=True, text=True
-        )
-        # The check should pass
-    finally:
-        os.unlink(script_path)
-
-
-def test_should_enable_probing_with_init_prefix():
-    """Test that probing handles init: prefix correctly."""
-    env = os.environ.copy()
-    # Clean environment variables first
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    env["PROBING"] = "init:/path/to/script.py+1"
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-    # Should extract "1" from "init:...+" and enable
-
-
-def test_should_enable_probing_with_init_prefix_no_setting():
-    """Test that probing is disabled when init: has no setting."""
-    env = os.environ.copy()
-    # Clean environment variables first
-    if "PROBING_ORIGINAL" in env:
-        del env["PROBING_ORIGINAL"]
-    env["PROBING"] = "init:/path/to/script.py"
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-c",
-            "import probing; print('enabled' if probing.is_enabled() else 'disabled')",
-        ],
-        env=env,
-        capture_output=True,
-        text=True,
-    )
-    # Should default to "0" and be disabled
+    result = probing_runner(PROBING="regex:.*\\.py$")
+    assert result.returncode == 0, result.stderr
+    assert "enabled" in result.stdout
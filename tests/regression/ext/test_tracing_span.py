@@ -1,5 +1,4 @@
 import dataclasses
-import time
 
 import pytest
 
@@ -183,11 +182,16 @@ def test_manual_span_without_recorded_wrapper_does_not_persist():
 
 def test_status_and_duration():
     with probing.span("timed") as s:
-        time.sleep(0.05)
+        pass
     assert s.status == "Completed"
     assert s.is_ended
+    # Duration is derived from the span's own timestamps, so it can be
+    # checked against them directly instead of burning wall time in a sleep.
     assert s.duration is not None
-    assert s.duration >= 0.05
+    assert s.duration >= 0.0
+    assert s.duration == pytest.approx(
+        (s.end_timestamp - s.start_timestamp) / 1e9
+    )
 
 
 def test_repr_contains_core_fields():
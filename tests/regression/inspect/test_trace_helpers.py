@@ -5,48 +5,39 @@ from types import ModuleType
 
 import pytest
 
+from probing.inspect.trace import _TraceableCollector
+
 
 class TestCreateFilter:
     """Test _TraceableCollector.create_filter method."""
 
-    def test_no_prefix_matches_all(self):
-        """Test that None prefix matches everything."""
-        from probing.inspect.trace import _TraceableCollector
-
-        filter_func = _TraceableCollector.create_filter(None)
-        assert filter_func("anything")
-        assert filter_func("test.module.func")
-        assert filter_func("")
-
-    def test_simple_prefix_matching(self):
-        """Test simple prefix matching without wildcards."""
-        from probing.inspect.trace import _TraceableCollector
-
-        filter_func = _TraceableCollector.create_filter("torch.nn")
-        assert filter_func("torch.nn.Linear")
-        assert filter_func("torch.nn.Module")
-        assert not filter_func("torch.optim.Adam")
-        assert not filter_func("numpy.array")
-
-    def test_wildcard_star_matching(self):
-        """Test wildcard * pattern matching."""
-        from probing.inspect.trace import _TraceableCollector
-
-        filter_func = _TraceableCollector.create_filter("torch.*.Linear")
-        assert filter_func("torch.nn.Linear")
-        assert filter_func("torch.cuda.Linear")
-        assert not filter_func("torch.Linear")
-        assert not filter_func("torch.nn.Conv2d")
-
-    def test_wildcard_question_matching(self):
-        """Test wildcard ? pattern matching."""
-        from probing.inspect.trace import _TraceableCollector
-
-        filter_func = _TraceableCollector.create_filter("test?")
-        assert filter_func("test1")
-        assert filter_func("testa")
-        assert not filter_func("test")
-        assert not filter_func("test12")
+    @pytest.mark.parametrize(
+        "prefix,candidate,expected",
+        [
+            # None prefix matches everything
+            (None, "anything", True),
+            (None, "test.module.func", True),
+            (None, "", True),
+            # Simple prefix matching without wildcards
+            ("torch.nn", "torch.nn.Linear", True),
+            ("torch.nn", "torch.nn.Module", True),
+            ("torch.nn", "torch.optim.Adam", False),
+            ("torch.nn", "numpy.array", False),
+            # Wildcard * pattern matching
+            ("torch.*.Linear", "torch.nn.Linear", True),
+            ("torch.*.Linear", "torch.cuda.Linear", True),
+            ("torch.*.Linear", "torch.Linear", False),
+            ("torch.*.Linear", "torch.nn.Conv2d", False),
+            # Wildcard ? pattern matching
+            ("test?", "test1", True),
+            ("test?", "testa", True),
+            ("test?", "test", False),
+            ("test?", "test12", False),
+        ],
+    )
+    def test_filter(self, prefix, candidate, expected):
+        filter_func = _TraceableCollector.create_filter(prefix)
+        assert bool(filter_func(candidate)) is expected
 
 
 class TestGetObjectName:
@@ -54,8 +45,6 @@ class TestGetObjectName:
 
     def test_function_with_name(self):
         """Test getting name from a function."""
-        from probing.inspect.trace import _TraceableCollector
-
         def test_func():
             pass
 
@@ -63,8 +52,6 @@ class TestGetObjectName:
 
     def test_class_with_name(self):
         """Test getting name from a class."""
-        from probing.inspect.trace import _TraceableCollector
-
         class TestClass:
             pass
 
@@ -72,21 +59,15 @@ class TestGetObjectName:
 
     def test_module_with_name(self):
         """Test getting name from a module."""
-        from probing.inspect.trace import _TraceableCollector
-
         assert _TraceableCollector.get_object_name(sys) == "sys"
 
     def test_object_without_name(self):
         """Test object without __name__ attribute."""
-        from probing.inspect.trace import _TraceableCollector
-
         obj = object()
         assert _TraceableCollector.get_object_name(obj) is None
 
     def test_object_with_non_string_name(self):
         """Test object with non-string __name__."""
-        from probing.inspect.trace import _TraceableCollector
-
         class BadName:
             __name__ = 123
 
@@ -99,85 +80,62 @@ class TestGetObjectName:
 class TestShouldSkipPrefix:
     """Test _TraceableCollector.should_skip_prefix method."""
 
-    def test_blacklisted_prefix(self):
-        """Test that blacklisted prefixes are skipped."""
-        from probing.inspect.trace import _TraceableCollector
-
-        blacklist = ["numpy", "typing"]
-        assert _TraceableCollector.should_skip_prefix("numpy", blacklist)
-        assert _TraceableCollector.should_skip_prefix("typing", blacklist)
-        # "torch" without a specific submodule is not in the allowed list
-        # (torch.nn, torch.cuda, torch.distributed, torch.optim)
-        # So it should be skipped
-        assert _TraceableCollector.should_skip_prefix("torch", blacklist)
-
-    def test_torch_allowed_prefixes(self):
-        """Test torch special handling."""
-        from probing.inspect.trace import _TraceableCollector
-
-        blacklist = []
-        assert not _TraceableCollector.should_skip_prefix("torch.nn.Linear", blacklist)
-        assert not _TraceableCollector.should_skip_prefix(
-            "torch.cuda.Module", blacklist
-        )
-        assert not _TraceableCollector.should_skip_prefix(
-            "torch.distributed.all_reduce", blacklist
-        )
-        assert not _TraceableCollector.should_skip_prefix("torch.optim.Adam", blacklist)
-        assert _TraceableCollector.should_skip_prefix("torch.utils", blacklist)
-        assert _TraceableCollector.should_skip_prefix("torch.autograd", blacklist)
-        # torchvision is a different package and should NOT be skipped
-        assert not _TraceableCollector.should_skip_prefix("torchvision", blacklist)
-        assert not _TraceableCollector.should_skip_prefix(
-            "torchvision.models", blacklist
-        )
-        assert not _TraceableCollector.should_skip_prefix("torchaudio", blacklist)
-
-    def test_six_module_skipped(self):
-        """Test that six.* modules are skipped."""
-        from probing.inspect.trace import _TraceableCollector
-
-        blacklist = []
-        assert _TraceableCollector.should_skip_prefix("six.moves", blacklist)
-        assert _TraceableCollector.should_skip_prefix("six.anything", blacklist)
-        assert not _TraceableCollector.should_skip_prefix("six", blacklist)
+    @pytest.mark.parametrize(
+        "prefix,blacklist,expected",
+        [
+            # Blacklisted prefixes are skipped
+            ("numpy", ["numpy", "typing"], True),
+            ("typing", ["numpy", "typing"], True),
+            # "torch" without a specific submodule is not in the allowed list
+            # (torch.nn, torch.cuda, torch.distributed, torch.optim), so it
+            # should be skipped
+            ("torch", ["numpy", "typing"], True),
+            # torch special handling
+            ("torch.nn.Linear", [], False),
+            ("torch.cuda.Module", [], False),
+            ("torch.distributed.all_reduce", [], False),
+            ("torch.optim.Adam", [], False),
+            ("torch.utils", [], True),
+            ("torch.autograd", [], True),
+            # torchvision/torchaudio are different packages and must NOT be
+            # skipped by the torch rule
+            ("torchvision", [], False),
+            ("torchvision.models", [], False),
+            ("torchaudio", [], False),
+            # six.* internals are skipped, six itself is not
+            ("six.moves", [], True),
+            ("six.anything", [], True),
+            ("six", [], False),
+        ],
+    )
+    def test_should_skip(self, prefix, blacklist, expected):
+        assert _TraceableCollector.should_skip_prefix(prefix, blacklist) is expected
+
+
+def _sample_function():
+    pass
+
+
+class _SampleClass:
+    pass
 
 
 class TestDetermineItemType:
     """Test _TraceableCollector.determine_item_type method."""
 
-    def test_function_type(self):
-        """Test function classification."""
-        from probing.inspect.trace import _TraceableCollector
-
-        def test_func():
-            pass
-
-        assert _TraceableCollector.determine_item_type(test_func) == "F"
-
-    def test_class_type(self):
-        """Test class classification."""
-        from probing.inspect.trace import _TraceableCollector
-
-        class TestClass:
-            pass
-
-        assert _TraceableCollector.determine_item_type(TestClass) == "C"
-
-    def test_module_type(self):
-        """Test module classification."""
-        from probing.inspect.trace import _TraceableCollector
-
-        assert _TraceableCollector.determine_item_type(sys) == "M"
-
-    def test_variable_type(self):
-        """Test variable classification."""
-        from probing.inspect.trace import _TraceableCollector
-
-        var = "test"
-        assert _TraceableCollector.determine_item_type(var) == "V"
-        assert _TraceableCollector.determine_item_type(123) == "V"
-        assert _TraceableCollector.determine_item_type([1, 2, 3]) == "V"
+    @pytest.mark.parametrize(
+        "obj,expected",
+        [
+            (_sample_function, "F"),
+            (_SampleClass, "C"),
+            (sys, "M"),
+            ("test", "V"),
+            (123, "V"),
+            ([1, 2, 3], "V"),
+        ],
+    )
+    def test_classification(self, obj, expected):
+        assert _TraceableCollector.determine_item_type(obj) == expected
 
 
 class TestTorchReduceOpDeprecation:
@@ -217,8 +175,6 @@ class TestShouldIncludeModule:
 
     def test_whitelisted_module(self):
         """Test that whitelisted modules are included."""
-        from probing.inspect.trace import _TraceableCollector
-
         whitelist = ["__main__", "test_module"]
         mock_module = ModuleType("test_module")
         assert _TraceableCollector.should_include_module(
@@ -227,8 +183,6 @@ class TestShouldIncludeModule:
 
     def test_probing_module(self):
         """Test that probing modules are included."""
-        from probing.inspect.trace import _TraceableCollector
-
         whitelist = []
         mock_module = ModuleType("probing.core")
         assert _TraceableCollector.should_include_module(
@@ -240,8 +194,6 @@ class TestShouldIncludeModule:
 
     def test_module_without_spec(self):
         """Test that modules without __spec__ are excluded."""
-        from probing.inspect.trace import _TraceableCollector
-
         whitelist = []
         mock_module = ModuleType("test")
         # Remove __spec__ if it exists
@@ -253,8 +205,6 @@ class TestShouldIncludeModule:
 
     def test_dunder_module_excluded(self):
         """Test that __name__ modules are excluded."""
-        from probing.inspect.trace import _TraceableCollector
-
         whitelist = []
         mock_module = ModuleType("__test__")
         assert not _TraceableCollector.should_include_module(
@@ -267,8 +217,6 @@ class TestFilterByPrefix:
 
     def test_no_prefix_returns_top_level(self):
         """Test that no prefix returns only top-level modules."""
-        from probing.inspect.trace import _TraceableCollector
-
         items = [
             {"name": "module1.func1", "type": "F"},
             {"name": "module1.func2", "type": "F"},
@@ -282,8 +230,6 @@ class TestFilterByPrefix:
 
     def test_wildcard_prefix_returns_all_matches(self):
         """Test that wildcard prefix returns all matching items."""
-        from probing.inspect.trace import _TraceableCollector
-
         items = [
             {"name": "torch.nn.Linear", "type": "F"},
             {"name": "torch.nn.Module", "type": "C"},
@@ -299,8 +245,6 @@ class TestFilterByPrefix:
 
     def test_exact_prefix_returns_one_level_deeper(self):
         """Test that exact prefix returns items one level deeper."""
-        from probing.inspect.trace import _TraceableCollector
-
         items = [
             {"name": "torch.nn.Linear", "type": "F"},
             {"name": "torch.nn.Module", "type": "C"},
@@ -317,8 +261,6 @@ class TestFilterByPrefix:
 
     def test_sorted_results(self):
         """Test that results are sorted by name."""
-        from probing.inspect.trace import _TraceableCollector
-
         items = [
             {"name": "zebra", "type": "F"},
             {"name": "alpha", "type": "F"},
@@ -330,4 +272,11 @@ class TestFilterByPrefix:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    # These helper tests are stateless static-method calls, so they split
+    # cleanly across workers when pytest-xdist is available.
+    try:
+        import xdist  # noqa: F401
+
+        pytest.main([__file__, "-v", "-n", "auto"])
+    except ImportError:
+        pytest.main([__file__, "-v"])
@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from probing.handlers.pythonext import handle_api_request
 from probing.handlers.router import (
     _handlers,
@@ -9,13 +11,31 @@ from probing.handlers.router import (
     handle_request,
 )
 
+# Registrations made by importing pythonext, captured once at module load.
+# Tests that pollute ``_handlers`` restore from this snapshot instead of
+# paying an ``importlib.reload`` of the whole extension module.
+_REGISTERED = dict(_handlers)
+
+
+def _restore_handlers():
+    _handlers.clear()
+    _handlers.update(_REGISTERED)
+
 
 class TestHandlerRouter:
     """Test the handler router system."""
 
-    def setup_method(self):
-        """Clear handlers before each test."""
-        _handlers.clear()
+    @pytest.fixture(autouse=True)
+    def _isolated_registry(self):
+        """Remove only the handlers a test registered, leaving the real ones.
+
+        Diffing keys keeps the registry live for the whole run (no clear /
+        re-import dance) and stays correct under any test ordering.
+        """
+        before = set(_handlers)
+        yield
+        for key in set(_handlers) - before:
+            del _handlers[key]
 
     def test_router_registration(self):
         """Test that handlers can be registered via decorator."""
@@ -146,10 +166,7 @@ class TestHandlerRouter:
 
 
 class TestUnifiedEntryPoint:
-    """Test the unified entry point."""
-
-    def setup_method(self):
-        import probing.handlers.pythonext  # noqa: F401
+    """Test the unified entry point (handlers registered by the module import)."""
 
     def test_handle_api_request(self):
         result = handle_api_request("trace/list", {})
@@ -171,15 +188,13 @@ class TestUnifiedEntryPoint:
 class TestHandlerRegistration:
     """Handler registration is covered by tests/regression/spec/test_api_spec.py."""
 
-    def setup_method(self):
-        _handlers.clear()
-        import importlib
-
-        import probing.handlers.pythonext
-
-        importlib.reload(probing.handlers.pythonext)
+    @pytest.fixture(autouse=True)
+    def _restore_after(self):
+        yield
+        _restore_handlers()
 
     def test_reload_does_not_duplicate_handlers(self):
+        # Reload on purpose: registration must be idempotent.
         import importlib
 
         import probing.handlers.pythonext